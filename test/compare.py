@@ -1,14 +1,16 @@
 import argparse
+import heapq
 import itertools
 import sys
 from collections import defaultdict
-from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Callable, TypeVar, Tuple, cast, Iterable, Set, DefaultDict, Optional, Dict, Generic, Sequence
+from typing import List, TypeVar, Tuple, cast, Iterable, Set, DefaultDict, Optional, Dict, Generic, Sequence, \
+    NamedTuple
 
+import numpy as np
 from mathutils import Vector
 from yk_gmd_blender.gmdlib.abstract.gmd_mesh import GMDMesh, GMDSkinnedMesh
-from yk_gmd_blender.gmdlib.abstract.gmd_shader import GMDVertexBuffer, GMDSkinnedVertexBuffer
+from yk_gmd_blender.gmdlib.abstract.gmd_shader import GMDVertexBuffer
 from yk_gmd_blender.gmdlib.abstract.nodes.gmd_bone import GMDBone
 from yk_gmd_blender.gmdlib.abstract.nodes.gmd_node import GMDNode
 from yk_gmd_blender.gmdlib.abstract.nodes.gmd_object import GMDSkinnedObject, GMDUnskinnedObject, GMDBoundingBox
@@ -21,7 +23,7 @@ from yk_gmd_blender.gmdlib.structure.endianness import check_are_vertices_big_en
 from yk_gmd_blender.gmdlib.structure.version import GMDVersion
 from yk_gmd_blender.meshlib.vertex_fusion import vertex_fusion, make_bone_indices_consistent
 
-T = TypeVar('T')
+nul_item = (0,)
 
 
 class ComparisonReporter:
@@ -60,50 +62,112 @@ class ComparisonReporter:
             raise GMDImportExportError(self.important_mismatches)
 
 
-def sort_src_dest_lists(src: Iterable[T], dst: Iterable[T], key: Callable[[T], str]) -> Tuple[List[T], List[T]]:
-    sorted_src: List[T] = [n for n in src]
-    sorted_src.sort(key=key)
-    sorted_dst: List[T] = [n for n in dst]
-    sorted_dst.sort(key=key)
+def group_meshes_by_attribute_set(meshes: List[GMDMesh]) -> Dict[str, List[GMDMesh]]:
+    """
+    Groups meshes by the value of their attribute set, in order of first appearance.
+    Attribute sets aren't hashable, so they are keyed by str(), which is only computed once per attribute set object.
+    """
+    key_by_id: Dict[int, str] = {}
+    groups: Dict[str, List[GMDMesh]] = {}
+    for m in meshes:
+        key = key_by_id.get(id(m.attribute_set))
+        if key is None:
+            key = key_by_id[id(m.attribute_set)] = str(m.attribute_set)
+        groups.setdefault(key, []).append(m)
+    return groups
 
-    return sorted_src, sorted_dst
 
+def quantize(data: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Quantize every element of data to ndigits decimal places, as integers scaled by 10**ndigits.
+    Integers hash faster than floats and don't suffer from -0.0/+0.0 style equality hazards.
+    data is upcast to float64 first, so small integer dtypes (i.e. uint8 bone indices) can't wrap around when scaled.
+    """
+    return np.rint(np.asarray(data, dtype=np.float64) * (10 ** ndigits)).astype(np.int64)
 
-@dataclass(frozen=True)
-class VertApproxData:
-    normal: Optional[Tuple]
-    tangent: Optional[Tuple]
 
-    @staticmethod
-    def new(normal: Optional[Vector], tangent: Optional[Vector]):
-        return VertApproxData(
-            normal=tuple(round(x, 2) for x in normal.resized(4)) if normal is not None else None,
-            tangent=tuple(round(x, 2) for x in tangent.resized(4)) if tangent is not None else None
-        )
+def dequantize(value: object, ndigits: int) -> object:
+    """
+    Inverse of quantize() for display purposes - scales every int in a (possibly nested) tuple back down
+    by 10**ndigits. Anything that isn't an int (i.e. bone names, field separators) is left alone.
+    """
+    if isinstance(value, int) and ndigits:
+        return value / (10 ** ndigits)
+    if isinstance(value, tuple):
+        return tuple(dequantize(v, ndigits) for v in value)
+    return value
+
+
+# Number of decimal places VertApproxData is quantized to
+APPROX_NDIGITS = 2
+# Minimum dot product for two VertApproxData normals to be considered equal.
+# Both normals are scaled by 10**APPROX_NDIGITS, so the 0.9 threshold has to be scaled twice.
+APPROX_EQ_THRESHOLD = 0.9 * (10 ** (2 * APPROX_NDIGITS))
+
+
+class VertApproxData(NamedTuple):
+    """
+    A NamedTuple rather than a dataclass, because there is one of these per unique vertex:
+    it has no per-instance __dict__, hashes as a plain tuple, and compares as (normal, tangent).
+    """
+    # Quantized to APPROX_NDIGITS decimal places
+    normal: Optional[Tuple[int, ...]]
+    tangent: Optional[Tuple[int, ...]]
 
     def approx_eq(self, other: 'VertApproxData') -> bool:
-        t = 0.9  # equality threshold
-        if self.normal is None:
-            if other.normal is not None:
-                return False
-        else:
-            if other.normal is None or Vector(self.normal).dot(Vector(other.normal)) < t:
+        # Dot products are done inline on the 4-tuples, which is cheaper than building mathutils Vectors for them
+        a = self.normal
+        b = other.normal
+        if a is None or b is None:
+            if a is not b:
                 return False
+        elif a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3] < APPROX_EQ_THRESHOLD:
+            return False
 
-        # if self.tangent is None:
-        #     if other.tangent is not None:
-        #         return False
-        # else:
-        #     if other.tangent is None or Vector(self.tangent).dot(Vector(other.tangent)) < t:
+        # a = self.tangent
+        # b = other.tangent
+        # if a is None or b is None:
+        #     if a is not b:
         #         return False
+        # elif a[0] * b[0] + a[1] * b[1] + a[2] * b[2] + a[3] * b[3] < APPROX_EQ_THRESHOLD:
+        #     return False
 
         return True
 
-    def __lt__(self, other) -> bool:
-        return (self.normal, self.tangent) < (other.normal, other.tangent)
 
-    def __gt__(self, other) -> bool:
-        return (self.normal, self.tangent) > (other.normal, other.tangent)
+def approx_match(self_normals: np.ndarray, other_normals: np.ndarray, t: float) -> np.ndarray:
+    """
+    Batched version of the normal check in VertApproxData.approx_eq.
+    Computes every dot product between the (k, 4) self_normals and (j, 4) other_normals in one matrix multiply,
+    and returns a (k,) boolean mask of which self_normals have at least one other_normal within the threshold.
+    """
+    return np.any((self_normals @ other_normals.T) >= t, axis=1)
+
+
+def approx_difference(self_approx: Tuple[VertApproxData, ...],
+                      other_approx: Tuple[VertApproxData, ...]) -> Tuple[VertApproxData, ...]:
+    """
+    Returns the elements of self_approx which aren't approx_eq to any element of other_approx.
+    Equivalent to checking approx_eq for every pair, but does the comparisons in bulk with approx_match.
+    """
+    # approx_eq only considers normals. Items without normals only match other items without normals.
+    other_has_none = any(v_a.normal is None for v_a in other_approx)
+    differing_va = [v_a for v_a in self_approx if v_a.normal is None and not other_has_none]
+
+    self_with_normal = [v_a for v_a in self_approx if v_a.normal is not None]
+    other_normals = [v_a.normal for v_a in other_approx if v_a.normal is not None]
+    if self_with_normal:
+        if other_normals:
+            mask = approx_match(
+                np.array([v_a.normal for v_a in self_with_normal], dtype=np.float32),
+                np.array(other_normals, dtype=np.float32),
+                APPROX_EQ_THRESHOLD
+            )
+            differing_va.extend(v_a for v_a, matched in zip(self_with_normal, mask) if not matched)
+        else:
+            differing_va.extend(self_with_normal)
+
+    return tuple(differing_va)
 
 
 class VertSet:
@@ -116,13 +180,24 @@ class VertSet:
     len: int
 
     def __init__(self):
-        self.verts = defaultdict(lambda: set())
+        self.verts = defaultdict(set)
         self.len = 0
 
     def add(self, vert_exact: Tuple, vert_approx: VertApproxData):
         self.verts[vert_exact].add(vert_approx)
         self.len += 1
 
+    def add_batch(self, pairs: Iterable[Tuple[Tuple, VertApproxData]]):
+        """
+        Equivalent to calling add() for each (vert_exact, vert_approx) pair, with less per-vertex overhead.
+        """
+        verts = self.verts
+        n = 0
+        for vert_exact, vert_approx in pairs:
+            verts[vert_exact].add(vert_approx)
+            n += 1
+        self.len += n
+
     def exact_difference(self, other: 'VertSet') -> Set[Tuple]:
         """
         Returns the difference in exact data of two vert-sets as a set
@@ -131,7 +206,7 @@ class VertSet:
         :param other: The other set
         :return: Set of vert_exact tuples not found in the other set
         """
-        return set(self.verts.keys()).difference(other.verts.keys())
+        return self.verts.keys() - other.verts.keys()
 
     def difference(self, other: 'VertSet') -> Dict[Tuple, Tuple[VertApproxData, ...]]:
         """
@@ -148,26 +223,40 @@ class VertSet:
 
         verts: Dict[Tuple, Tuple[VertApproxData, ...]] = {}
 
-        key_set = set(self.verts.keys())
-
         # 1. Find vert_exacts that don't match
-        for vert_exact in key_set.difference(other.verts.keys()):
+        for vert_exact in self.verts.keys() - other.verts.keys():
             # foreach vert_exact that doesn't exist in the other verts
             # add all (vert_exact, vert_approx) pairs to the set
             verts[vert_exact] = tuple(v_a for v_a in self.verts[vert_exact])
 
         # 2. Find vert_approx that don't match within vert_exacts that do match
-        for vert_exact in key_set.intersection(other.verts.keys()):
-            # foreach vert_exact that is in both sets
-            # check the vert_approx lists
-            self_approx = self.verts[vert_exact]
-            other_approx = other.verts[vert_exact]
-            # O(n^2), but there shouldn't be many items in either list
-            differing_va = tuple(
-                v_a
-                for v_a in self_approx
-                if not any(v_a.approx_eq(v_a_alt) for v_a_alt in other_approx)
+        # Iterate over whichever set is smaller, and look up the vert_exact in the larger one.
+        # Use .get() so the lookups don't insert empty sets into the defaultdicts.
+        shared: Iterable[Tuple[Tuple, Optional[Set[VertApproxData]], Optional[Set[VertApproxData]]]]
+        if len(self.verts) <= len(other.verts):
+            shared = (
+                (vert_exact, self_approx, other.verts.get(vert_exact))
+                for vert_exact, self_approx in self.verts.items()
+            )
+        else:
+            shared = (
+                (vert_exact, self.verts.get(vert_exact), other_approx)
+                for vert_exact, other_approx in other.verts.items()
             )
+        for vert_exact, self_approx, other_approx in shared:
+            if self_approx is None or other_approx is None:
+                continue
+            # vert_exact is in both sets
+            # check the vert_approx lists
+            if len(self_approx) == 1 and len(other_approx) == 1:
+                # Common case, a single comparison is cheaper than building arrays for approx_match
+                differing_va = tuple(
+                    v_a
+                    for v_a in self_approx
+                    if not any(v_a.approx_eq(v_a_alt) for v_a_alt in other_approx)
+                )
+            else:
+                differing_va = approx_difference(tuple(self_approx), tuple(other_approx))
             if len(differing_va) > 0:
                 verts[vert_exact] = differing_va
 
@@ -177,6 +266,9 @@ class VertSet:
         return self.len
 
 
+# Offsets of the 3x3x3 block of voxels around (and including) a voxel
+NEIGHBOURS = cast(Tuple[Tuple[int, int, int], ...], tuple(itertools.product((-1, 0, 1), repeat=3)))
+
 TExact = TypeVar('TExact')
 TApprox = TypeVar('TApprox')
 
@@ -185,22 +277,34 @@ class VertVoxelSet(Generic[TExact, TApprox]):
     """
     Class for storing sets of vertex data grouped into 3D voxels
     """
-    # Mapping of (voxel centre) -> [vert_index for each vert in voxel]
-    voxels: DefaultDict[Tuple[int, int, int], List[int]]
+    # Mapping of (voxel centre) -> (exact data) -> [vert_index for each vert in voxel with that exact data]
+    # Vertices can only be equivalent if their exact data matches, so grouping by it up-front
+    # means check_fusions only has to do distance checks against potential matches.
+    voxels: DefaultDict[Tuple[int, int, int], DefaultDict[TExact, List[int]]]
     # List of (pos, exact data, approx data)
     verts: List[Tuple[Vector, TExact, TApprox]]
+    # List of (x, y, z) for each vert, packed into an array by positions_array() for vectorized distance checks
+    positions: List[Tuple[float, float, float]]
     voxel_size: float
 
     def __init__(self, voxel_size: float = 0.0001):
-        self.voxels = defaultdict(list)
+        self.voxels = defaultdict(lambda: defaultdict(list))
         self.voxel_size = voxel_size
         self.verts = []
+        self.positions = []
 
     def add(self, pos: Vector, exact: TExact, approx: TApprox):
         voxel = (
             int(pos.x / self.voxel_size), int(pos.y / self.voxel_size), int(pos.z / self.voxel_size))
-        self.voxels[voxel].append(len(self.verts))
+        self.voxels[voxel][exact].append(len(self.verts))
         self.verts.append((pos, exact, approx))
+        self.positions.append((pos.x, pos.y, pos.z))
+
+    def positions_array(self) -> np.ndarray:
+        """
+        Returns the positions of all verts as an (N, 3) float32 array.
+        """
+        return np.array(self.positions, dtype=np.float32).reshape(-1, 3)
 
     def check_fusions(self, other: 'VertVoxelSet', pos_epsilon: float = 0.00001):
         # AAAH
@@ -228,56 +332,116 @@ class VertVoxelSet(Generic[TExact, TApprox]):
         has_no_equiv_in_other: List[Tuple[Vector, TExact, TApprox]] = []
         too_many_equiv_in_other: List[Tuple[Vector, TExact, List[Tuple[int, TApprox]], List[Tuple[int, TApprox]]]] = []
 
-        counted_other_verts: Set[int] = set()
         pos_epsilon_sqr = pos_epsilon ** 2
 
-        for voxel_key, verts in self.voxels.items():
-            other_search_space = [
-                (other_i, other.verts[other_i])
-                for x in (voxel_key[0] - 1, voxel_key[0], voxel_key[0] + 1)
-                for y in (voxel_key[1] - 1, voxel_key[1], voxel_key[1] + 1)
-                for z in (voxel_key[2] - 1, voxel_key[2], voxel_key[2] + 1)
-                if (x, y, z) in other.voxels
-                for other_i in other.voxels[(x, y, z)]
-            ]
-            self_search_space = [
-                (self_i, self.verts[self_i])
-                for x in (voxel_key[0] - 1, voxel_key[0], voxel_key[0] + 1)
-                for y in (voxel_key[1] - 1, voxel_key[1], voxel_key[1] + 1)
-                for z in (voxel_key[2] - 1, voxel_key[2], voxel_key[2] + 1)
-                if (x, y, z) in self.voxels
-                for self_i in self.voxels[(x, y, z)]
+        # Gather the self_verts and candidates of every group of vertices sharing a voxel and exact data first,
+        # then expand them into (self_vert, candidate) index pairs and do all the distance checks in a single
+        # vectorized pass.
+        group_verts: List[int] = []
+        group_n_verts: List[int] = []
+        other_group_cands: List[int] = []
+        other_group_n_cands: List[int] = []
+        self_group_cands: List[int] = []
+        self_group_n_cands: List[int] = []
+
+        other_voxels = other.voxels
+        self_voxels = self.voxels
+        for voxel_key, voxel in self_voxels.items():
+            # Look up each neighbouring voxel in both sets with the same computed key
+            kx, ky, kz = voxel_key
+            other_search_voxels = []
+            self_search_voxels = []
+            for dx, dy, dz in NEIGHBOURS:
+                search_voxel = (kx + dx, ky + dy, kz + dz)
+                other_v = other_voxels.get(search_voxel)
+                if other_v is not None:
+                    other_search_voxels.append(other_v)
+                self_v = self_voxels.get(search_voxel)
+                if self_v is not None:
+                    self_search_voxels.append(self_v)
+
+            for exact, verts in voxel.items():
+                # Only vertices with the same exact data can be equivalent
+                group_verts.extend(verts)
+                group_n_verts.append(len(verts))
+                n_cands = len(other_group_cands)
+                for v in other_search_voxels:
+                    other_group_cands.extend(v.get(exact, ()))
+                other_group_n_cands.append(len(other_group_cands) - n_cands)
+                n_cands = len(self_group_cands)
+                for v in self_search_voxels:
+                    self_group_cands.extend(v.get(exact, ()))
+                self_group_n_cands.append(len(self_group_cands) - n_cands)
+
+        verts_arr = np.array(group_verts, dtype=np.int64)
+        n_verts_arr = np.array(group_n_verts, dtype=np.int64)
+
+        def expand_pairs(group_cands: List[int], group_n_cands: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+            """
+            Expands each group into the cartesian product of its self_verts and candidates,
+            returning the flat (pair_verts, pair_cands) arrays.
+            """
+            cands_arr = np.array(group_cands, dtype=np.int64)
+            n_cands = np.array(group_n_cands, dtype=np.int64)
+            # For each self_vert, the (start, length) of its group's candidates in cands_arr
+            vert_cand_starts = np.repeat(np.cumsum(n_cands) - n_cands, n_verts_arr)
+            vert_n_cands = np.repeat(n_cands, n_verts_arr)
+            # Each self_vert is repeated once per candidate, and the candidates of its group follow in order
+            pair_verts = np.repeat(verts_arr, vert_n_cands)
+            pair_run_starts = np.cumsum(vert_n_cands) - vert_n_cands
+            pair_cand_idxs = np.arange(len(pair_verts)) - np.repeat(pair_run_starts - vert_cand_starts, vert_n_cands)
+            return pair_verts, cands_arr[pair_cand_idxs]
+
+        def find_pairs_in_range(group_cands: List[int], group_n_cands: List[int],
+                                cand_positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            """
+            Returns the candidates within pos_epsilon of each vertex in CSR form (offsets, cands),
+            where the candidates for self_vert are cands[offsets[self_vert]:offsets[self_vert + 1]]
+            """
+            pair_verts, pair_cands = expand_pairs(group_cands, group_n_cands)
+            in_range = ((self_positions[pair_verts] - cand_positions[pair_cands]) ** 2).sum(axis=1) < pos_epsilon_sqr
+            pair_verts = pair_verts[in_range]
+            pair_cands = pair_cands[in_range]
+            offsets = np.zeros(len(self) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(pair_verts, minlength=len(self)), out=offsets[1:])
+            return offsets, pair_cands[np.argsort(pair_verts, kind="stable")]
+
+        self_positions = self.positions_array()
+        other_offsets, other_matches = find_pairs_in_range(other_group_cands, other_group_n_cands,
+                                                           other.positions_array())
+        self_offsets, self_matches = find_pairs_in_range(self_group_cands, self_group_n_cands, self_positions)
+
+        # Decide which vertices need reporting from the match counts alone,
+        # and only build the (index, approx data) lists for those.
+        n_other_matches = np.diff(other_offsets)
+        n_self_matches = np.diff(self_offsets)
+        # Every vertex should at least match itself
+        assert np.all(n_self_matches > 0)
+
+        def potential_verts(vs: 'VertVoxelSet', offsets: np.ndarray, matches: np.ndarray,
+                            self_vert: int) -> List[Tuple[int, TApprox]]:
+            return [
+                (fused_i, vs.verts[fused_i][2])
+                for fused_i in matches[offsets[self_vert]:offsets[self_vert + 1]].tolist()
             ]
 
-            for self_vert in verts:
-                self_pos, self_exact, self_approx = self.verts[self_vert]
+        for self_vert in np.flatnonzero(n_other_matches == 0).tolist():
+            has_no_equiv_in_other.append(self.verts[self_vert])
+        for self_vert in np.flatnonzero(n_other_matches > n_self_matches).tolist():
+            self_pos, self_exact, _ = self.verts[self_vert]
+            too_many_equiv_in_other.append((
+                self_pos,
+                self_exact,
+                potential_verts(self, self_offsets, self_matches, self_vert),
+                potential_verts(other, other_offsets, other_matches, self_vert)
+            ))
 
-                potential_other_verts = [
-                    (fused_i, a)
-                    for fused_i, (p, e, a) in other_search_space
-                    if e == self_exact and
-                       (self_pos - p).length_squared < pos_epsilon_sqr
-                ]
-                counted_other_verts.update(i for (i, _) in potential_other_verts)
-
-                potential_self_verts = [
-                    (fused_i, a)
-                    for fused_i, (p, e, a) in self_search_space
-                    if e == self_exact and
-                       (self_pos - p).length_squared < pos_epsilon_sqr
-                ]
-                assert len(potential_self_verts) > 0
-
-                if len(potential_other_verts) == 0:
-                    has_no_equiv_in_other.append((self_pos, self_exact, self_approx))
-                elif len(potential_other_verts) > len(potential_self_verts):
-                    too_many_equiv_in_other.append(
-                        (self_pos, self_exact, potential_self_verts, potential_other_verts))
+        counted_other_verts = np.zeros(len(other), dtype=bool)
+        counted_other_verts[other_matches] = True
 
         other_vs_with_no_equiv_in_self = [
             other.verts[other_i]
-            for other_i in range(len(other))
-            if other_i not in counted_other_verts
+            for other_i in np.flatnonzero(~counted_other_verts).tolist()
         ]
 
         return has_no_equiv_in_other, too_many_equiv_in_other, other_vs_with_no_equiv_in_self
@@ -286,62 +450,118 @@ class VertVoxelSet(Generic[TExact, TApprox]):
         return len(self.verts)
 
 
+def quantized_rows(data: Optional[np.ndarray], idxs: np.ndarray, ndigits: int) -> Iterable[Tuple]:
+    """
+    Quantize data[idxs] to ndigits decimal places in a single NumPy pass, and return the rows as tuples.
+    If data is None, returns an endless iterable of nul_item instead.
+    """
+    if data is None:
+        return itertools.repeat(nul_item)
+    return map(tuple, quantize(data[idxs], ndigits).tolist())
+
+
+def quantized_uv_rows(uvs: List[np.ndarray], idxs: np.ndarray, ndigits: int) -> Iterable[Tuple]:
+    """
+    Quantize each UV buffer at idxs to ndigits decimal places, and return the concatenated UVs for each row as tuples.
+    """
+    if not uvs:
+        return itertools.repeat(())
+    # Quantize each buffer separately, so each is rounded at its own precision
+    return map(tuple, np.hstack([quantize(uv[idxs], ndigits) for uv in uvs]).tolist())
+
+
+def approx_rows(buf: GMDVertexBuffer, idxs: np.ndarray) -> Iterable[VertApproxData]:
+    """
+    Build the VertApproxData for each vertex of buf at idxs.
+    """
+
+    def resized4_rows(data: Optional[np.ndarray]) -> Iterable[Optional[Tuple]]:
+        if data is None:
+            return itertools.repeat(None)
+        # Equivalent to Vector.resized(4) - truncate or pad with zeroes
+        data = data[idxs, :4]
+        if data.shape[1] < 4:
+            data = np.pad(data, ((0, 0), (0, 4 - data.shape[1])))
+        return map(tuple, quantize(data, APPROX_NDIGITS).tolist())
+
+    return (
+        VertApproxData(normal=normal, tangent=tangent)
+        for normal, tangent in zip(resized4_rows(buf.normal), resized4_rows(buf.tangent))
+    )
+
+
+# Number of decimal places each field of the get_unique_verts/get_unique_skinned_verts exact tuples is quantized to
+EXACT_VERT_NDIGITS = (2, 4, 4, 2, 2, 2, 2, 0, 0, 0, 2)
+EXACT_SKINNED_VERT_NDIGITS = (2, 4, 4, 2, 2, 2, 2, 0, 4)
+
+
+def format_exact_vert(vert_exact: Tuple, ndigits: Tuple[int, ...]) -> str:
+    return str(tuple(
+        x if x == nul_item else dequantize(x, n)
+        for x, n in zip(vert_exact, ndigits)
+    ))
+
+
+def format_approx_vert(vert_approx: VertApproxData) -> str:
+    return (f"VertApproxData(normal={dequantize(vert_approx.normal, APPROX_NDIGITS)}, "
+            f"tangent={dequantize(vert_approx.tangent, APPROX_NDIGITS)})")
+
+
 def get_unique_verts(ms: List[GMDMesh]) -> VertSet:
-    nul_item = (0,)
     all_verts = VertSet()
     for gmd_mesh in ms:
         buf = gmd_mesh.vertices_data
-        for i in set(gmd_mesh.triangles.triangle_strips_noreset):
-            all_verts.add(
-                (
-                    tuple(round(x, 2) for x in buf.pos[i]),
-                    round(buf.normal[i][3], 4) if buf.normal is not None else nul_item,
-                    round(buf.tangent[i][3], 4) if buf.tangent is not None else nul_item,
-                    tuple(round(x, 2) for x in buf.col0[i]) if buf.col0 is not None else nul_item,
-                    tuple(round(x, 2) for x in buf.col1[i]) if buf.col1 is not None else nul_item,
-                    tuple(round(x, 2) for x in buf.unk[i]) if buf.unk is not None else nul_item,
-                    tuple(round(x, 2) for uv in buf.uvs for x in uv[i]),
-                    "b",
-                    tuple(round(x, 1) for x in buf.bone_data[i]) if buf.bone_data is not None else nul_item,
-                    "w",
-                    tuple(round(x, 2) for x in buf.weight_data[i]) if buf.weight_data is not None else nul_item,
-                ),
-                VertApproxData.new(
-                    normal=Vector(buf.normal[i]) if buf.normal is not None else None,
-                    tangent=Vector(buf.tangent[i]) if buf.tangent is not None else None
-                )
-            )
+        idxs = np.unique(np.asarray(gmd_mesh.triangles.triangle_strips_noreset))
+        exacts = zip(
+            quantized_rows(buf.pos, idxs, 2),
+            quantize(buf.normal[idxs, 3], 4).tolist() if buf.normal is not None else itertools.repeat(nul_item),
+            quantize(buf.tangent[idxs, 3], 4).tolist() if buf.tangent is not None else itertools.repeat(nul_item),
+            quantized_rows(buf.col0, idxs, 2),
+            quantized_rows(buf.col1, idxs, 2),
+            quantized_rows(buf.unk, idxs, 2),
+            quantized_uv_rows(buf.uvs, idxs, 2),
+            itertools.repeat("b"),
+            # Bone indices are integers already, so don't need scaling
+            quantized_rows(buf.bone_data, idxs, 0),
+            itertools.repeat("w"),
+            quantized_rows(buf.weight_data, idxs, 2),
+        )
+        all_verts.add_batch(zip(exacts, approx_rows(buf, idxs)))
     return all_verts
 
 
 def get_unique_skinned_verts(ms: List[GMDSkinnedMesh]) -> VertSet:
-    nul_item = (0,)
     all_verts = VertSet()
     for gmd_mesh in ms:
         buf = gmd_mesh.vertices_data
-        for i in set(gmd_mesh.triangles.triangle_strips_noreset):
-            assert (buf.bone_data is not None) and (buf.weight_data is not None)
-            all_verts.add(
-                (
-                    tuple(round(x, 2) for x in buf.pos[i]),
-                    round(buf.normal[i][3], 4) if buf.normal is not None else nul_item,
-                    round(buf.tangent[i][3], 4) if buf.tangent is not None else nul_item,
-                    tuple(round(x, 2) for x in buf.col0[i]) if buf.col0 is not None else nul_item,
-                    tuple(round(x, 2) for x in buf.col1[i]) if buf.col1 is not None else nul_item,
-                    tuple(round(x, 2) for x in buf.unk[i]) if buf.unk is not None else nul_item,
-                    tuple(round(x, 2) for uv in buf.uvs for x in uv[i]),
-                    "bw",
-                    tuple(
-                        (gmd_mesh.relevant_bones[int(b)].name, round(w, 4))
-                        for (b, w) in zip(buf.bone_data[i], buf.weight_data[i])
-                        if w > 0
-                    ) if (buf.bone_data is not None) and (buf.weight_data is not None) else nul_item,
-                ),
-                VertApproxData.new(
-                    normal=Vector(buf.normal[i]) if buf.normal is not None else None,
-                    tangent=Vector(buf.tangent[i]) if buf.tangent is not None else None
-                )
+        assert (buf.bone_data is not None) and (buf.weight_data is not None)
+        idxs = np.unique(np.asarray(gmd_mesh.triangles.triangle_strips_noreset))
+        bone_names = [b.name for b in gmd_mesh.relevant_bones]
+        weights = buf.weight_data[idxs]
+        bws = (
+            tuple(
+                (bone_names[b], w)
+                for (b, w, used) in zip(bone_row, weight_row, used_row)
+                if used
+            )
+            for (bone_row, weight_row, used_row) in zip(
+                buf.bone_data[idxs].astype(int).tolist(),
+                quantize(weights, 4).tolist(),
+                (weights > 0).tolist()
             )
+        )
+        exacts = zip(
+            quantized_rows(buf.pos, idxs, 2),
+            quantize(buf.normal[idxs, 3], 4).tolist() if buf.normal is not None else itertools.repeat(nul_item),
+            quantize(buf.tangent[idxs, 3], 4).tolist() if buf.tangent is not None else itertools.repeat(nul_item),
+            quantized_rows(buf.col0, idxs, 2),
+            quantized_rows(buf.col1, idxs, 2),
+            quantized_rows(buf.unk, idxs, 2),
+            quantized_uv_rows(buf.uvs, idxs, 2),
+            itertools.repeat("bw"),
+            bws,
+        )
+        all_verts.add_batch(zip(exacts, approx_rows(buf, idxs)))
     return all_verts
 
 
@@ -351,8 +571,6 @@ def compare_same_layout_mesh_vertex_fusions(skinned: bool, src: List[GMDMesh], d
     # The point of this test is to check that reexporting data didn't unfuse some vertices
     # i.e. we want to make sure every fused vertex in src has *exactly* one equivalent fused vertex in dst
 
-    nul_item = (0,)
-
     # Create a set of fused vertices for src and dst
     # Use a Voxel set, where the vertices are grouped by position, to make finding nearby vertices for fusion less complex
     def find_fusion_output_vs(ms: List[GMDMesh]) -> VertVoxelSet:
@@ -365,38 +583,60 @@ def compare_same_layout_mesh_vertex_fusions(skinned: bool, src: List[GMDMesh], d
             unfused_vs = [m.vertices_data for m in ms]
         fused_idx_to_buf_idx, _, _ = vertex_fusion([m.triangles.triangle_list for m in ms], unfused_vs)
 
-        rounded_bw: tuple
+        def rounded_dir_rows(buf: GMDVertexBuffer, data: Optional[np.ndarray]) -> List[Optional[Tuple]]:
+            if data is None:
+                return [None] * len(buf)
+            # Round as float64 so the values print cleanly in mismatch reports
+            return [tuple(row) for row in np.round(data[:, :3].astype(np.float64), 3).tolist()]
 
+        # Round the (normal, tangent) approx data for every vertex up-front, once per buffer
+        buf_approxs = [
+            list(zip(rounded_dir_rows(buf, buf.normal), rounded_dir_rows(buf, buf.tangent)))
+            for buf in unfused_vs
+        ]
+
+        # Rounded bone/weight data for every vertex of every buffer
+        buf_bws: List[List[Tuple]]
         all_verts: VertVoxelSet[Tuple, Optional[Tuple]] = VertVoxelSet()
         if relevant_bones is not None:
-            for (fused_i, buf_idxs) in enumerate(fused_idx_to_buf_idx):
-                buf_idx, i = buf_idxs[0]
-                buf = cast(GMDSkinnedVertexBuffer, unfused_vs[buf_idx])
-
-                exact_pos = Vector(buf.pos[i])
-                rounded_bw = (
-                    tuple(
-                        (relevant_bones[int(bone)].name, round(weight, 4))
-                        for bone, weight in zip(buf.bone_data[i], buf.weight_data[i])
-                        if weight > 0
-                    ) if (buf.bone_data is not None) and (buf.weight_data is not None) else nul_item,
-                )
-                norm = tuple(round(n, 3) for n in buf.normal[i][:3]) if buf.normal is not None else None
-                tang = tuple(round(n, 3) for n in buf.tangent[i][:3]) if buf.tangent is not None else None
-                all_verts.add(exact_pos, rounded_bw, (norm, tang))
+            bone_names = [bone.name for bone in relevant_bones]
+
+            def rounded_bw_rows(buf: GMDVertexBuffer) -> List[Tuple]:
+                # Skinned buffers always have bone and weight data
+                assert (buf.bone_data is not None) and (buf.weight_data is not None)
+                return [
+                    (tuple(
+                        (bone_names[bone], weight)
+                        for bone, weight, used in zip(bone_row, weight_row, used_row)
+                        if used
+                    ),)
+                    for bone_row, weight_row, used_row in zip(
+                        buf.bone_data.astype(np.int64).tolist(),
+                        np.round(buf.weight_data.astype(np.float64), 4).tolist(),
+                        (buf.weight_data > 0).tolist(),
+                    )
+                ]
+
+            # Round the bone weights for the whole buffer up-front, and look up bone names from a flat list
+            buf_bws = [rounded_bw_rows(buf) for buf in unfused_vs]
         else:
-            for (fused_i, buf_idxs) in enumerate(fused_idx_to_buf_idx):
-                buf_idx, i = buf_idxs[0]
-                buf = unfused_vs[buf_idx]
-
-                exact_pos = Vector(buf.pos[i])
-                rounded_bw = (
-                    tuple(round(x, 4) for x in buf.bone_data[i]) if buf.bone_data is not None else nul_item,
-                    tuple(round(x, 4) for x in buf.weight_data[i]) if buf.weight_data is not None else nul_item,
-                )
-                norm = tuple(round(n, 3) for n in buf.normal[i][:3]) if buf.normal is not None else None
-                tang = tuple(round(n, 3) for n in buf.tangent[i][:3]) if buf.tangent is not None else None
-                all_verts.add(exact_pos, rounded_bw, (norm, tang))
+            def rounded_rows_or_nul(buf: GMDVertexBuffer, data: Optional[np.ndarray]) -> List[Tuple]:
+                if data is None:
+                    return [nul_item] * len(buf)
+                return [tuple(row) for row in np.round(data.astype(np.float64), 4).tolist()]
+
+            # Decide whether each buffer has bones/weights once, and round them for the whole buffer up-front
+            buf_bws = [
+                list(zip(rounded_rows_or_nul(buf, buf.bone_data), rounded_rows_or_nul(buf, buf.weight_data)))
+                for buf in unfused_vs
+            ]
+
+        # Convert each buffer's positions to Python lists once, instead of indexing into the arrays per vertex
+        buf_positions = [buf.pos.tolist() for buf in unfused_vs]
+
+        for (fused_i, buf_idxs) in enumerate(fused_idx_to_buf_idx):
+            buf_idx, i = buf_idxs[0]
+            all_verts.add(Vector(buf_positions[buf_idx][i]), buf_bws[buf_idx][i], buf_approxs[buf_idx][i])
 
         return all_verts
 
@@ -409,13 +649,11 @@ def compare_same_layout_mesh_vertex_fusions(skinned: bool, src: List[GMDMesh], d
     (src_vs_with_no_equiv, src_vs_unfused_in_dst, dst_vs_with_no_equiv_in_src) = \
         src_fused_vs.check_fusions(dst_fused_vs)
     if src_vs_with_no_equiv or src_vs_unfused_in_dst or dst_vs_with_no_equiv_in_src:
-        src_with_no_equiv_str = '\n\t'.join(str(x) for x in itertools.islice(sorted(src_vs_with_no_equiv), 5))
+        src_with_no_equiv_str = '\n\t'.join(str(x) for x in heapq.nsmallest(5, src_vs_with_no_equiv))
         n_in_src_unfused = len(set(i for _, _, ss, _ in src_vs_unfused_in_dst for i, _ in ss))
         n_in_dst_unfused = len(set(i for _, _, _, ds in src_vs_unfused_in_dst for i, _ in ds))
-        src_unfused_str = '\n\t'.join(
-            str(x) for x in
-            itertools.islice(sorted([v for v in src_vs_unfused_in_dst]), 5))
-        dst_with_no_equiv_str = '\n\t'.join(str(x) for x in itertools.islice(sorted(dst_vs_with_no_equiv_in_src), 5))
+        src_unfused_str = '\n\t'.join(str(x) for x in heapq.nsmallest(5, src_vs_unfused_in_dst))
+        dst_with_no_equiv_str = '\n\t'.join(str(x) for x in heapq.nsmallest(5, dst_vs_with_no_equiv_in_src))
         cmp.important_mismatch(
             f"{context}src ({src_n_fused_vs} fused vs) and dst ({dst_n_fused_vs} fused vs) (delta {dst_n_fused_vs - src_n_fused_vs}) don't match\n\t"
             f"found {len(src_vs_with_no_equiv)} vs in src with no equiv in dst:\n\t"
@@ -442,12 +680,19 @@ def compare_same_layout_meshes(skinned: bool, src: List[GMDMesh], dst: List[GMDM
         src_vertices = get_unique_verts(src)
         dst_vertices = get_unique_verts(dst)
 
+    # The exact tuples are quantized, so are scaled back down to print them
+    ndigits = EXACT_SKINNED_VERT_NDIGITS if skinned else EXACT_VERT_NDIGITS
+
     src_but_not_dst_exact = src_vertices.exact_difference(dst_vertices)
     dst_but_not_src_exact = dst_vertices.exact_difference(src_vertices)
 
     if src_but_not_dst_exact or dst_but_not_src_exact:
-        src_but_not_dst_str = '\n\t'.join(str(x) for x in itertools.islice(sorted(src_but_not_dst_exact), 5))
-        dst_but_not_src_str = '\n\t'.join(str(x) for x in itertools.islice(sorted(dst_but_not_src_exact), 5))
+        src_but_not_dst_str = '\n\t'.join(
+            format_exact_vert(x, ndigits) for x in heapq.nsmallest(5, src_but_not_dst_exact)
+        )
+        dst_but_not_src_str = '\n\t'.join(
+            format_exact_vert(x, ndigits) for x in heapq.nsmallest(5, dst_but_not_src_exact)
+        )
         cmp.important_mismatch(
             f"{context}src ({len(src_vertices)} unique verts) and dst ({len(dst_vertices)} unique verts) exact data differs\n\t"
             f"src meshes have {len(src_but_not_dst_exact)} vertices missing in dst:\n\t"
@@ -461,12 +706,12 @@ def compare_same_layout_meshes(skinned: bool, src: List[GMDMesh], dst: List[GMDM
 
     if src_but_not_dst or dst_but_not_src:
         src_but_not_dst_str = '\n\t'.join(
-            f"{str(k)}:\n\t\t" + '\n\t\t'.join(str(x) for x in src_but_not_dst[k])
-            for k in itertools.islice(sorted(src_but_not_dst.keys()), 5)
+            f"{format_exact_vert(k, ndigits)}:\n\t\t" + '\n\t\t'.join(format_approx_vert(x) for x in src_but_not_dst[k])
+            for k in heapq.nsmallest(5, src_but_not_dst.keys())
         )
         dst_but_not_src_str = '\n\t'.join(
-            f"{str(k)}:\n\t\t" + '\n\t\t'.join(str(x) for x in dst_but_not_src[k])
-            for k in itertools.islice(sorted(dst_but_not_src.keys()), 5)
+            f"{format_exact_vert(k, ndigits)}:\n\t\t" + '\n\t\t'.join(format_approx_vert(x) for x in dst_but_not_src[k])
+            for k in heapq.nsmallest(5, dst_but_not_src.keys())
         )
         cmp.unimportant_mismatch(
             f"{context}src ({len(src_vertices)} unique verts) and dst ({len(dst_vertices)} unique verts) APPROX data differs\n\t"
@@ -480,32 +725,33 @@ def compare_same_layout_meshes(skinned: bool, src: List[GMDMesh], dst: List[GMDM
 
 def compare_single_node_pair(skinned: bool, vertices: bool, src: GMDNode, dst: GMDNode, cmp: ComparisonReporter,
                              context: str):
-    from math import fabs
-
     def compare_field(f: str):
         if getattr(src, f) != getattr(dst, f):
             cmp.important_mismatch(
                 f"{context}field '{f}' differs:\nsrc:\n\t{getattr(src, f)}\ndst:\n\t{getattr(dst, f)}")
 
     def compare_vec_field(f: str):
-        src_f = tuple(round(x, 3) for x in getattr(src, f))
-        dst_f = tuple(round(x, 3) for x in getattr(dst, f))
-        if src_f != dst_f:
-            if sum(fabs(s - r) for (s, r) in zip(src_f, dst_f)) > 0.05:
-                cmp.important_mismatch(f"{context}vector '{f}'' differs:\nsrc:\n\t{src_f}\ndst:\n\t{dst_f}")
+        src_f = quantize(np.asarray(getattr(src, f), dtype=np.float64), 3)
+        dst_f = quantize(np.asarray(getattr(dst, f), dtype=np.float64), 3)
+        if not np.array_equal(src_f, dst_f):
+            # Quantized values are scaled by 10**3
+            if np.abs(src_f - dst_f).sum() > 0.05 * (10 ** 3):
+                cmp.important_mismatch(
+                    f"{context}vector '{f}'' differs:\nsrc:\n\t{getattr(src, f)}\ndst:\n\t{getattr(dst, f)}")
             else:
-                cmp.unimportant_mismatch(f"{context}vector '{f}' differs slightly:\nsrc:\n\t{src_f}\ndst:\n\t{dst_f}")
+                cmp.unimportant_mismatch(
+                    f"{context}vector '{f}' differs slightly:\nsrc:\n\t{getattr(src, f)}\ndst:\n\t{getattr(dst, f)}")
 
     def compare_mat_field(f: str):
-        src_f = tuple(tuple(round(x, 3) for x in v) for v in getattr(src, f))
-        dst_f = tuple(tuple(round(x, 3) for x in v) for v in getattr(dst, f))
-        if src_f != dst_f:
-            src_floats = tuple(x for v in src_f for x in v)
-            dst_floats = tuple(x for v in dst_f for x in v)
-            if sum(fabs(s - r) for (s, r) in zip(src_floats, dst_floats)) > 0.05:
-                cmp.important_mismatch(f"{context}matrix '{f}' differs:\nsrc:\n\t{src_f}\ndst:\n\t{dst_f}")
+        src_f = np.round(np.asarray(getattr(src, f), dtype=np.float64), 3)
+        dst_f = np.round(np.asarray(getattr(dst, f), dtype=np.float64), 3)
+        if not np.array_equal(src_f, dst_f):
+            if np.abs(src_f - dst_f).sum() > 0.05:
+                cmp.important_mismatch(
+                    f"{context}matrix '{f}' differs:\nsrc:\n\t{src_f.tolist()}\ndst:\n\t{dst_f.tolist()}")
             else:
-                cmp.unimportant_mismatch(f"{context}matrix '{f}' differs slightly:\nsrc:\n\t{src_f}\ndst:\n\t{dst_f}")
+                cmp.unimportant_mismatch(
+                    f"{context}matrix '{f}' differs slightly:\nsrc:\n\t{src_f.tolist()}\ndst:\n\t{dst_f.tolist()}")
 
     # Compare subclass-agnostic, hierarchy-agnostic values
     compare_field("node_type")
@@ -534,16 +780,15 @@ def compare_single_node_pair(skinned: bool, vertices: bool, src: GMDNode, dst: G
             assert isinstance(src, (GMDSkinnedObject, GMDUnskinnedObject))
             assert isinstance(dst, (GMDSkinnedObject, GMDUnskinnedObject))
 
-            src_attrs = set(str(m.attribute_set) for m in cast(List[GMDMesh], src.mesh_list))
-            dst_attrs = set(str(m.attribute_set) for m in cast(List[GMDMesh], dst.mesh_list))
+            # Group the meshes by attribute set in a single pass.
+            # src and dst have separate attribute set objects, so they're matched by str() (i.e. by value).
+            src_groups = group_meshes_by_attribute_set(cast(List[GMDMesh], src.mesh_list))
+            dst_groups = group_meshes_by_attribute_set(cast(List[GMDMesh], dst.mesh_list))
 
             # Generate sorted attribute set lists to compare them
             # If there are different materials, there's a problem
-            sorted_attrs_src, sorted_attrs_dst = sort_src_dest_lists(
-                src_attrs,
-                dst_attrs,
-                key=lambda x: x
-            )
+            sorted_attrs_src = sorted(src_groups.keys())
+            sorted_attrs_dst = sorted(dst_groups.keys())
 
             if sorted_attrs_src != sorted_attrs_dst:
                 cmp.important_mismatch(
@@ -552,15 +797,10 @@ def compare_single_node_pair(skinned: bool, vertices: bool, src: GMDNode, dst: G
             if vertices:
                 # For each unique attribute set
                 # compare the vertices in the sets of meshes that use it
-                unique_attr_sets = []
-                for m in src.mesh_list:
-                    if m.attribute_set not in unique_attr_sets:
-                        unique_attr_sets.append(m.attribute_set)
-
                 identical = True
-                for attr in unique_attr_sets:
-                    src_ms = [m for m in src.mesh_list if m.attribute_set == attr]
-                    dst_ms = [m for m in dst.mesh_list if m.attribute_set == attr]
+                for attr_key, src_ms in src_groups.items():
+                    attr = src_ms[0].attribute_set
+                    dst_ms = dst_groups.get(attr_key, [])
 
                     if not compare_same_layout_meshes(
                             skinned,
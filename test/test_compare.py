@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from compare import quantize, quantized_rows, format_exact_vert, nul_item, EXACT_VERT_NDIGITS
+
+
+@pytest.mark.order(2)
+def test_quantize_uint8_bones_dont_wrap():
+    bone_data = np.array([
+        [3, 0, 0, 0],
+        [131, 0, 0, 0],
+        [26, 255, 0, 0],
+    ], dtype=np.uint8)
+    idxs = np.arange(len(bone_data))
+
+    for ndigits in (0, 1):
+        rows = list(quantized_rows(bone_data, idxs, ndigits))
+        # Bones 3 and 131 must stay distinct
+        assert rows[0] != rows[1]
+        assert rows == [tuple(int(b) * (10 ** ndigits) for b in row) for row in bone_data.tolist()]
+
+    assert quantize(np.array([26], dtype=np.uint8), 1).tolist() == [260]
+
+
+@pytest.mark.order(2)
+def test_format_exact_vert_dequantizes():
+    vert_exact = (
+        (-74, 0, 20), 10000, 3465, nul_item, nul_item, nul_item, (50, 25), "b", (3, 131, 0, 0), "w", (75, 25, 0, 0)
+    )
+    assert format_exact_vert(vert_exact, EXACT_VERT_NDIGITS) == str((
+        (-0.74, 0.0, 0.2), 1.0, 0.3465, nul_item, nul_item, nul_item, (0.5, 0.25), "b", (3, 131, 0, 0), "w",
+        (0.75, 0.25, 0.0, 0.0)
+    ))
@@ -1,7 +1,20 @@
+import copy
+import pickle
+from dataclasses import dataclass
+
+import numpy as np
 import pytest
 
+from mathutils import Vector, Quaternion
+from yk_gmd_blender.gmdlib.structure.common.checksum_str import ChecksumStrStruct, ChecksumStrStruct_Unpack
+from yk_gmd_blender.gmdlib.structure.common.matrix import MatrixUnpacker
+from yk_gmd_blender.gmdlib.structure.common.mesh import IndicesStruct, MeshStruct
+from yk_gmd_blender.gmdlib.structure.common.node import NodeStruct, NodeStackOp, NodeType
+from yk_gmd_blender.gmdlib.structure.kenzan.mesh import MeshStruct_Kenzan
+from yk_gmd_blender.gmdlib.structure.yk1.mesh import MeshStruct_YK1
+from yk_gmd_blender.structurelib.base import PackingValidationError, StructureUnpacker
 from yk_gmd_blender.structurelib.primitives import c_uint8, c_uint16, c_uint32, c_uint64, c_int8, c_int32, c_int64, \
-    c_int16, c_unorm8, c_u8_Minus1_1
+    c_int16, c_unorm8, c_u8_Minus1_1, c_uint16_bulk, c_float32
 
 
 # This module tests the structurelib finite-range primitive types,
@@ -54,6 +67,31 @@ def test_prim_uint16_selfconsistent():
         assert d_out_big == d
 
 
+@pytest.mark.order(2)
+def test_prim_uint16_bulk_array_selfconsistent():
+    datapoints = list(range(0, 65_536, 257))
+    for big_endian in (False, True):
+        b = bytearray()
+        c_uint16_bulk.pack_array(big_endian, datapoints, b)
+
+        # Bulk packing should give the same bytes as packing element-by-element
+        b_elementwise = bytearray()
+        c_uint16.pack_array(big_endian, datapoints, b_elementwise)
+        assert b == b_elementwise
+
+        d_out, off = c_uint16_bulk.unpack_array(big_endian, b, 0, len(datapoints))
+        assert off == len(b)
+        assert d_out.tolist() == datapoints
+
+
+@pytest.mark.order(2)
+def test_prim_uint16_bulk_array_out_of_range():
+    with pytest.raises(PackingValidationError):
+        c_uint16_bulk.pack_array(False, [0, 65_536], bytearray())
+    with pytest.raises(PackingValidationError):
+        c_uint16_bulk.pack_array(False, [-1], bytearray())
+
+
 @pytest.mark.order(2)
 def test_prim_uint32_selfconsistent():
     start, end = 0, 4_294_967_295
@@ -256,3 +294,172 @@ def test_prim_u8_Minus1_1_exhaustive_repack():
         t.pack(True, d, b_prime)
 
     assert list(b_prime) == list(b)
+
+
+@pytest.mark.order(2)
+def test_matrix_array_matches_elementwise():
+    t = MatrixUnpacker
+    # Non-symmetric matrices, so a transposed layout can't go unnoticed
+    n = 5
+    floats = np.arange(n * 16, dtype=np.float32).reshape(n, 16) * 0.5 - 7.25
+    assert not np.array_equal(floats.reshape(n, 4, 4), floats.reshape(n, 4, 4).transpose(0, 2, 1))
+
+    for big_endian in (False, True):
+        b = bytearray(b"\xAB" * 3)
+        for m in floats:
+            for f in m:
+                c_float32.pack(big_endian, float(f), b)
+
+        arr, end = t.unpack_array(big_endian, b, 3, n)
+        assert arr.shape == (n, 4, 4)
+        assert end == len(b)
+
+        off = 3
+        matrices = []
+        for i in range(n):
+            m, off = t.unpack(big_endian, b, off)
+            matrices.append(m)
+            assert np.array_equal(arr[i], np.array(m, dtype=np.float32))
+        assert off == end
+
+        # Packing the array and packing each matrix individually should both reproduce the original bytes
+        b_array = bytearray(b[:3])
+        t.pack_array(big_endian, arr, b_array)
+        assert b_array == b
+
+        b_elementwise = bytearray(b[:3])
+        for m in matrices:
+            t.pack(big_endian, m, b_elementwise)
+        assert b_elementwise == b
+
+        # pack_array also accepts a list of matrices
+        b_list = bytearray(b[:3])
+        t.pack_array(big_endian, matrices, b_list)
+        assert b_list == b
+
+
+@pytest.mark.order(2)
+def test_checksum_str_array_matches_elementwise():
+    t = ChecksumStrStruct_Unpack
+    values = [
+        # Exactly 30 bytes, so has no null terminator
+        ChecksumStrStruct.make_from_str("abcdefghijklmnopqrstuvwxyz0123"),
+        # Non-ASCII, encoded as shift_jis
+        ChecksumStrStruct.make_from_str("桐生一馬"),
+        ChecksumStrStruct.make_from_str(""),
+        ChecksumStrStruct.make_from_str("c_am_kiryu"),
+    ]
+    assert len(values[0].text.encode("shift_jis")) == 30
+
+    for big_endian in (False, True):
+        b = bytearray(b"\xAB" * 3)
+        for v in values:
+            t.pack(big_endian, v, b)
+
+        arr, end = t.unpack_array(big_endian, b, 3, len(values))
+        assert end == len(b)
+        assert arr == values
+
+        off = 3
+        for a in arr:
+            v, off = t.unpack(big_endian, b, off)
+            assert a == v
+        assert off == end
+
+        b_prime = bytearray(b[:3])
+        t.pack_array(big_endian, arr, b_prime)
+        assert b_prime == b
+
+
+@dataclass(frozen=True)
+class MixedPrimitiveStruct:
+    a: int
+    b: int
+    c: float
+    d: int
+    e: int
+    f: int
+    padding: int = 0
+
+
+@pytest.mark.order(2)
+def test_fused_structure_matches_field_by_field():
+    fields = [
+        ("a", c_uint8),
+        # Starts at an odd offset, which the fused struct mustn't align
+        ("b", c_int16),
+        ("c", c_float32),
+        ("padding", c_uint16),
+        ("d", c_uint32),
+        ("e", c_int8),
+        ("f", c_uint64),
+    ]
+    # Every field is a plain primitive, so this takes the single-struct path
+    fused = StructureUnpacker(MixedPrimitiveStruct, fields=fields)
+
+    values = [
+        MixedPrimitiveStruct(a=0xFE, b=-12345, c=1.5, d=0xDEADBEEF, e=-7, f=0x0123_4567_89AB_CDEF),
+        MixedPrimitiveStruct(a=0, b=32_767, c=-2.25, d=0, e=127, f=0, padding=0xFFFF),
+    ]
+
+    for big_endian in (False, True):
+        # Start at an odd offset too
+        b = bytearray(b"\xAB" * 3)
+        for v in values:
+            for field_name, field_unpacker in fields:
+                field_unpacker.pack(big_endian, getattr(v, field_name), b)
+        b_fused = bytearray(b"\xAB" * 3)
+        for v in values:
+            fused.pack(big_endian, v, b_fused)
+        assert b_fused == b
+        assert len(b) == 3 + len(values) * fused.sizeof()
+
+        off_fused = off_field_by_field = 3
+        for v in values:
+            v_fused, off_fused = fused.unpack(big_endian, b, off_fused)
+            field_values = {}
+            for field_name, field_unpacker in fields:
+                field_values[field_name], off_field_by_field = \
+                    field_unpacker.unpack(big_endian, b, off_field_by_field)
+            assert v_fused == MixedPrimitiveStruct(**field_values) == v
+            assert off_fused == off_field_by_field
+        assert off_fused == len(b)
+
+
+@pytest.mark.order(2)
+def test_slotted_structs_copy_and_pickle():
+    def make_node(vec, quat):
+        return NodeStruct(
+            index=1, parent_of=2, sibling_of=-1, object_index=3, matrix_index=1,
+            stack_op=NodeStackOp.PopPush, name_index=4, node_type=NodeType.SkinnedMesh,
+            pos=vec((1.0, 2.0, 3.0, 1.0)), rot=quat((1.0, 0.0, 0.0, 0.0)), scale=vec((1.0, 1.0, 1.0, 0.0)),
+            world_pos=vec((4.0, 5.0, 6.0, 1.0)), anim_axis=vec((0.0, 0.0, 0.0, 0.0)), flags=[0, 1, 2, 3],
+        )
+
+    def make_mesh(mesh_type, indices):
+        return mesh_type(
+            index=1, attribute_index=2, vertex_buffer_index=3, object_index=4, node_index=5, min_index=6,
+            vertex_count=7, vertex_offset_from_index=8, matrixlist_offset=9, matrixlist_length=10,
+            triangle_list_indices=indices, noreset_strip_indices=indices, reset_strip_indices=indices,
+        )
+
+    indices = IndicesStruct(index_offset=10, index_count=20)
+    values = [
+        ChecksumStrStruct.make_from_str("c_am_kiryu"),
+        indices,
+        make_mesh(MeshStruct, indices),
+        make_mesh(MeshStruct_Kenzan, indices),
+        make_mesh(MeshStruct_YK1, indices),
+        make_node(Vector, Quaternion),
+    ]
+    # mathutils types can't be pickled themselves, so pickle a NodeStruct holding plain tuples instead
+    picklable = values[:-1] + [make_node(tuple, tuple)]
+
+    for v in values:
+        for v_copy in (copy.copy(v), copy.deepcopy(v)):
+            assert type(v_copy) is type(v)
+            assert v_copy == v
+    for v in picklable:
+        v_pickled = pickle.loads(pickle.dumps(v))
+        assert type(v_pickled) is type(v)
+        assert v_pickled == v
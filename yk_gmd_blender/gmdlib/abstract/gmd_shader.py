@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional, Tuple, List, Sized, Iterable, Set
+from dataclasses import dataclass, field
+from typing import Optional, Tuple, List, Sized, Iterable, Set, Union
 
 import numpy as np
 
@@ -183,6 +183,15 @@ class GMDVertexBufferLayout:
 
     packing_flags: int
 
+    # Structured dtypes for each endianness, built once in __post_init__
+    _le_dtype: np.dtype = field(init=False, repr=False, compare=False)
+    _be_dtype: np.dtype = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Layouts are immutable, so the dtypes can be built up front and reused for every buffer with this layout
+        object.__setattr__(self, "_le_dtype", self._build_numpy_dtype(False))
+        object.__setattr__(self, "_be_dtype", self._build_numpy_dtype(True))
+
     def __str__(self):
         return f"GMDVertexBufferLayout(\n" \
                f"assume_skinned: {self.assume_skinned},\n" \
@@ -402,6 +411,9 @@ class GMDVertexBufferLayout:
         )
 
     def numpy_dtype(self, big_endian: bool) -> np.dtype:
+        return self._be_dtype if big_endian else self._le_dtype
+
+    def _build_numpy_dtype(self, big_endian: bool) -> np.dtype:
         names = ["pos"]
         formats = [self.pos_storage.numpy_native_dtype(big_endian)]
         offsets = [0]
@@ -435,7 +447,7 @@ class GMDVertexBufferLayout:
         return self.numpy_dtype(False).itemsize
 
     def unpack_from(self, big_endian: bool, vertex_count: int,
-                    data: bytes, offset: int) -> Tuple[GMDVertexBuffer, int]:
+                    data: Union[bytes, memoryview], offset: int) -> Tuple[GMDVertexBuffer, int]:
         numpy_dtype = self.numpy_dtype(big_endian)
         vertices_np = np.frombuffer(data, numpy_dtype, count=vertex_count, offset=offset)
         offset += vertex_count * numpy_dtype.itemsize
@@ -5,6 +5,7 @@ import time
 from enum import Enum
 from typing import List, Tuple, cast, Union, TypeVar, Generic, Optional
 
+import numpy as np
 from mathutils import Matrix
 from yk_gmd_blender.gmdlib.abstract.gmd_attributes import GMDAttributeSet, GMDUnk14, GMDUnk12, GMDMaterial
 from yk_gmd_blender.gmdlib.abstract.gmd_mesh import GMDMesh, GMDSkinnedMesh, GMDMeshIndices
@@ -23,7 +24,6 @@ from yk_gmd_blender.gmdlib.structure.common.node import NodeType, NodeStruct, No
 from yk_gmd_blender.gmdlib.structure.common.unks import Unk14Struct, Unk12Struct
 from yk_gmd_blender.gmdlib.structure.common.vertex_buffer_layout import VertexBufferLayoutStruct
 from yk_gmd_blender.gmdlib.structure.version import VersionProperties
-from yk_gmd_blender.structurelib.base import FixedSizeArrayUnpacker
 from yk_gmd_blender.structurelib.primitives import c_uint16, c_uint8
 
 
@@ -87,7 +87,7 @@ class GMDAbstractor_Common(abc.ABC, Generic[TFileData]):
 
     def build_vertex_buffers_from_structs(self,
 
-                                          vertex_layout_arr: List[VertexBufferLayoutStruct], vertex_bytes: bytes,
+                                          vertex_layout_arr: List[VertexBufferLayoutStruct], vertex_bytes: Union[bytes, memoryview],
 
                                           profile: bool = False) \
             -> List[GMDVertexBuffer]:
@@ -216,7 +216,7 @@ class GMDAbstractor_Common(abc.ABC, Generic[TFileData]):
     def build_node_hierarchy_from_structs(self,
 
                                           node_arr: List[NodeStruct],
-                                          node_name_arr: List[ChecksumStrStruct], matrix_arr: List[Matrix],
+                                          node_name_arr: List[ChecksumStrStruct], matrix_arr: np.ndarray,
                                           object_bboxes: List[GMDBoundingBox]) \
             -> List[GMDNode]:
         nodes = []
@@ -242,7 +242,7 @@ class GMDAbstractor_Common(abc.ABC, Generic[TFileData]):
 
                     world_pos=node_struct.world_pos,
                     anim_axis=node_struct.anim_axis,
-                    matrix=matrix_arr[node_struct.matrix_index],
+                    matrix=Matrix(matrix_arr[node_struct.matrix_index].tolist()),
 
                     parent=parent_stack.peek() if parent_stack else None,
                     flags=node_struct.flags
@@ -272,7 +272,7 @@ class GMDAbstractor_Common(abc.ABC, Generic[TFileData]):
                 if not (0 <= node_struct.matrix_index < len(matrix_arr)):
                     self.error.fatal(f"Unskinned object {name} doesn't reference a valid matrix")
 
-                matrix = matrix_arr[node_struct.matrix_index]
+                matrix = Matrix(matrix_arr[node_struct.matrix_index].tolist())
 
                 node = GMDUnskinnedObject(
                     name=name,
@@ -306,7 +306,8 @@ class GMDAbstractor_Common(abc.ABC, Generic[TFileData]):
                                   abstract_vertex_buffers: List[GMDVertexBuffer],
                                   abstract_nodes_ordered: List[GMDNode],
 
-                                  mesh_arr: List[MeshStruct], index_buffer: List[int], mesh_matrix_bytestrings: bytes,
+                                  mesh_arr: List[MeshStruct], index_buffer: np.ndarray,
+                                  mesh_matrix_bytestrings: Union[bytes, memoryview],
                                   bytestrings_are_16bit: bool,
                                   ) \
             -> List[Union[GMDSkinnedMesh, GMDMesh]]:
@@ -315,6 +316,9 @@ class GMDAbstractor_Common(abc.ABC, Generic[TFileData]):
 
         # TODO: Check if uses_relative_indices and not(uses_min_index), that should error?
 
+        bytestring_dtype = np.dtype(np.uint16 if bytestrings_are_16bit else np.uint8) \
+            .newbyteorder(">" if self.file_is_big_endian else "<")
+
         def read_bytestring(start_byte: int, length: int):
             if (not mesh_matrix_bytestrings) or (length == 0):
                 return []
@@ -327,9 +331,7 @@ class GMDAbstractor_Common(abc.ABC, Generic[TFileData]):
                 self.error.fatal(
                     f"Bytestring length mismatch: expected {length}, got {actual_len}. bytes: {actual_bytes}")
 
-            data, _ = FixedSizeArrayUnpacker(unpack_type, length).unpack(self.file_is_big_endian,
-                                                                         mesh_matrix_bytestrings, offset=offset)
-            return data
+            return np.frombuffer(mesh_matrix_bytestrings, dtype=bytestring_dtype, count=length, offset=offset).tolist()
 
         # Take a range, look up that range in the index buffer, return normalized indices from 0 to vertex_count.
         # Use the min_index, max_index arguments with the index buffer contents to figure out the minimum index
@@ -347,11 +349,19 @@ class GMDAbstractor_Common(abc.ABC, Generic[TFileData]):
             if indices_range.index_count == 0:
                 return None, min_index, max_index
 
+            # Slicing would silently truncate a range which runs off the end of the buffer
+            if index_ptr_max > len(index_buffer):
+                self.error.fatal(
+                    f"Index range {index_ptr_min}..{index_ptr_max} runs past the end of the index buffer "
+                    f"({len(index_buffer)} indices)")
+
+            index_range = index_buffer[index_ptr_min:index_ptr_max]
+
             if file_uses_relative_indices:
                 index_offset = 0
             else:
                 # Look through the range and find the smallest index, take everything relative to that.
-                smallest_index = min(index_buffer[i] for i in range(index_ptr_min, index_ptr_max))
+                smallest_index = int(index_range.min())
                 if file_uses_min_index:
                     index_offset = mesh_struct.min_index
                     if mesh_struct.min_index > smallest_index:
@@ -363,17 +373,23 @@ class GMDAbstractor_Common(abc.ABC, Generic[TFileData]):
                 else:
                     index_offset = smallest_index
 
-            indices = array.array("H")
-            for i in range(index_ptr_min, index_ptr_max):
-                index = index_buffer[i]
-                if not (ignore_FFFF and index == 0xFFFF):
-                    # Update min/max absolute index values
-                    min_index = min(min_index, index)
-                    max_index = max(max_index, index)
-
-                    index = index - index_offset
-
-                indices.append(index)
+            if ignore_FFFF:
+                used = (index_range != 0xFFFF)
+                used_indices = index_range[used]
+            else:
+                used = np.ones(len(index_range), dtype=bool)
+                used_indices = index_range
+
+            if len(used_indices):
+                # Update min/max absolute index values
+                min_index = min(min_index, int(used_indices.min()))
+                max_index = max(max_index, int(used_indices.max()))
+
+            # Widen before subtracting so an index below index_offset goes negative
+            # and is rejected by the array, instead of wrapping around
+            relative_indices = index_range.astype(np.int64)
+            relative_indices[used] -= index_offset
+            indices = array.array("H", relative_indices.tolist())
             return indices, min_index, max_index
 
         meshes = []
@@ -479,7 +495,11 @@ class GMDAbstractor_Common(abc.ABC, Generic[TFileData]):
                               abstract_nodes: List[GMDNode],
 
                               node_arr: List[NodeStruct],
-                              object_drawlist_ptrs: List[int], mesh_drawlists: bytes):
+                              object_drawlist_ptrs: List[int], mesh_drawlists: Union[bytes, memoryview]):
+        big_endian = self.file_is_big_endian
+        # Each drawlist is a (length, zero) header followed by (material index, mesh index) pairs
+        u16_dtype = np.dtype(np.uint16).newbyteorder(">" if big_endian else "<")
+        drawlist_entry_dtype = np.dtype([("material_idx", u16_dtype), ("mesh_idx", u16_dtype)])
         for i, node_struct in enumerate(node_arr):
             if node_struct.node_type in [NodeType.UnskinnedMesh, NodeType.SkinnedMesh]:
                 abstract_node = abstract_nodes[i]
@@ -494,13 +514,10 @@ class GMDAbstractor_Common(abc.ABC, Generic[TFileData]):
 
                 drawlist_ptr = object_drawlist_ptrs[node_struct.object_index]
                 offset = drawlist_ptr
-                big_endian = self.file_is_big_endian
                 drawlist_len, offset = c_uint16.unpack(big_endian, mesh_drawlists, offset)
                 zero, offset = c_uint16.unpack(big_endian, mesh_drawlists, offset)
-                for i in range(drawlist_len):
-                    material_idx, offset = c_uint16.unpack(big_endian, mesh_drawlists, offset)
-                    mesh_idx, offset = c_uint16.unpack(big_endian, mesh_drawlists, offset)
-
+                drawlist = np.frombuffer(mesh_drawlists, dtype=drawlist_entry_dtype, count=drawlist_len, offset=offset)
+                for material_idx, mesh_idx in drawlist.tolist():
                     abstract_attribute_set = abstract_attribute_sets[material_idx]
                     abstract_mesh = abstract_meshes[mesh_idx]
                     if abstract_attribute_set != abstract_mesh.attribute_set:
@@ -1,3 +1,4 @@
+import numpy as np
 from mathutils import Quaternion, Vector
 from yk_gmd_blender.gmdlib.abstract.gmd_attributes import GMDUnk12
 from yk_gmd_blender.gmdlib.abstract.gmd_mesh import GMDSkinnedMesh
@@ -305,13 +306,15 @@ def pack_abstract_contents_YK1(version_properties: VersionProperties, file_big_e
         mesh_arr=mesh_arr,
         attribute_arr=attribute_arr,
         material_arr=material_arr,
-        matrix_arr=rearranged_data.ordered_matrices,
+        matrix_arr=np.array(rearranged_data.ordered_matrices, dtype=np.float32).reshape(-1, 4, 4),
         vertex_buffer_arr=vertex_buffer_arr,
-        vertex_data=bytes(vertex_data_bytearray),
+        # View the buffer instead of copying it - FilePacker copies it into the file data anyway
+        vertex_data=memoryview(vertex_data_bytearray),
         texture_arr=rearranged_data.texture_names,
         shader_arr=rearranged_data.shader_names,
         node_name_arr=rearranged_data.node_names,
-        index_data=index_buffer,
+        # Not cast to uint16 here, so c_uint16_bulk can range-check the indices when packing
+        index_data=np.asarray(index_buffer),
         object_drawlist_bytes=bytes(drawlist_bytearray),
         mesh_matrixlist_bytes=packed_mesh_matrixlists,
 
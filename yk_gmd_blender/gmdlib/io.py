@@ -15,13 +15,10 @@ from yk_gmd_blender.gmdlib.errors.error_reporter import ErrorReporter
 from yk_gmd_blender.gmdlib.structure.common.file import FileUnpackError, FileData_Common
 from yk_gmd_blender.gmdlib.structure.common.header import GMDHeaderStruct, GMDHeaderStruct_Unpack
 from yk_gmd_blender.gmdlib.structure.dragon.file import FilePacker_Dragon, FileData_Dragon
-from yk_gmd_blender.gmdlib.structure.dragon.header import GMDHeader_Dragon_Unpack
 from yk_gmd_blender.gmdlib.structure.endianness import check_is_file_big_endian
 from yk_gmd_blender.gmdlib.structure.kenzan.file import FileData_Kenzan, FilePacker_Kenzan
-from yk_gmd_blender.gmdlib.structure.kenzan.header import GMDHeader_Kenzan_Unpack
 from yk_gmd_blender.gmdlib.structure.version import GMDVersion, VersionProperties
 from yk_gmd_blender.gmdlib.structure.yk1.file import FileData_YK1, FilePacker_YK1
-from yk_gmd_blender.gmdlib.structure.yk1.header import GMDHeader_YK1_Unpack
 
 
 def _get_file_data(data: Union[Path, str, bytes], error_reporter: ErrorReporter) -> bytes:
@@ -61,24 +58,21 @@ def read_gmd_structures(data: Union[Path, str, bytes], error_reporter: ErrorRepo
     version_props = base_header.get_version_properties()
     if version_props.major_version == GMDVersion.Kiwami1:
         try:
-            header, _ = GMDHeader_YK1_Unpack.unpack(big_endian, data=data, offset=0)
-            contents, _ = FilePacker_YK1.unpack(big_endian, data=data, offset=0)
+            header, contents = FilePacker_YK1.unpack_with_header(big_endian, data=data, offset=0)
 
             return version_props, header, contents
         except FileUnpackError as e:
             error_reporter.fatal(str(e))
     elif version_props.major_version == GMDVersion.Kenzan:
         try:
-            header, _ = GMDHeader_Kenzan_Unpack.unpack(big_endian, data=data, offset=0)
-            contents, _ = FilePacker_Kenzan.unpack(big_endian, data=data, offset=0)
+            header, contents = FilePacker_Kenzan.unpack_with_header(big_endian, data=data, offset=0)
 
             return version_props, header, contents
         except FileUnpackError as e:
             error_reporter.fatal(str(e))
     elif version_props.major_version == GMDVersion.Dragon:
         try:
-            header, _ = GMDHeader_Dragon_Unpack.unpack(big_endian, data=data, offset=0)
-            contents, _ = FilePacker_Dragon.unpack(big_endian, data=data, offset=0)
+            header, contents = FilePacker_Dragon.unpack_with_header(big_endian, data=data, offset=0)
 
             return version_props, header, contents
         except FileUnpackError as e:
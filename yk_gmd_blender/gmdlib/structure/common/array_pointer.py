@@ -1,7 +1,9 @@
 from dataclasses import dataclass
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar, List, Union
 
-from yk_gmd_blender.structurelib.base import BaseUnpacker, FixedSizeArrayUnpacker, StructureUnpacker
+import numpy as np
+
+from yk_gmd_blender.structurelib.base import BaseUnpacker, StructureUnpacker
 from yk_gmd_blender.gmdlib.structure.common.sized_pointer import SizedPointerStruct, SizedPointerStruct_Unpack
 
 T = TypeVar('T')
@@ -11,8 +13,9 @@ T = TypeVar('T')
 class ArrayPointerStruct(Generic[T]):
     sized_ptr: SizedPointerStruct
 
-    def extract(self, unpack: BaseUnpacker[T], big_endian: bool, data: bytes) -> List[T]:
-        return FixedSizeArrayUnpacker(unpack, self.sized_ptr.size).unpack(big_endian, data, self.sized_ptr.ptr)[0]
+    def extract(self, unpack: BaseUnpacker[T], big_endian: bool, data: Union[bytes, bytearray, memoryview]) \
+            -> Union[List[T], np.ndarray]:
+        return unpack.unpack_array(big_endian, data, self.sized_ptr.ptr, self.sized_ptr.size)[0]
 
     @property
     def ptr(self):
@@ -1,11 +1,18 @@
+import struct
 from dataclasses import dataclass
+from typing import List, Tuple, Union
 
-from yk_gmd_blender.structurelib.base import StructureUnpacker, FixedSizeASCIIUnpacker
+from yk_gmd_blender.structurelib.base import StructureUnpacker, FixedSizeASCIIUnpacker, FrozenSlotsMixin
 from yk_gmd_blender.structurelib.primitives import c_uint16
 
 
 @dataclass(frozen=True)
-class ChecksumStrStruct:
+class ChecksumStrStruct(FrozenSlotsMixin):
+    __slots__ = (
+        "checksum",
+        "text",
+    )
+
     checksum: int
     text: str
 
@@ -14,10 +21,37 @@ class ChecksumStrStruct:
         return ChecksumStrStruct(sum(text.encode("shift_jis")), text)
 
 
-ChecksumStrStruct_Unpack = StructureUnpacker(
-    ChecksumStrStruct,
-    fields=[
-        ("checksum", c_uint16),
-        ("text", FixedSizeASCIIUnpacker(30, encoding="shift_jis"))
-    ]
-)
+class ChecksumStrStructUnpacker(StructureUnpacker[ChecksumStrStruct]):
+    """
+    Unpacks ChecksumStrStructs field-by-field like any other structure,
+    but decodes whole arrays with a single struct.iter_unpack() call.
+    """
+    _text_unpacker: FixedSizeASCIIUnpacker
+    _be_array_struct: struct.Struct
+    _le_array_struct: struct.Struct
+
+    def __init__(self):
+        self._text_unpacker = FixedSizeASCIIUnpacker(30, encoding="shift_jis")
+        super().__init__(
+            ChecksumStrStruct,
+            fields=[
+                ("checksum", c_uint16),
+                ("text", self._text_unpacker)
+            ]
+        )
+        self._be_array_struct = struct.Struct(f">H{self._text_unpacker.length}s")
+        self._le_array_struct = struct.Struct(f"<H{self._text_unpacker.length}s")
+
+    def unpack_array(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int, count: int) \
+            -> Tuple[List[ChecksumStrStruct], int]:
+        s = self._be_array_struct if big_endian else self._le_array_struct
+        end = offset + count * s.size
+        encoding = self._text_unpacker.encoding
+        value = [
+            ChecksumStrStruct(checksum, text.decode(encoding).rstrip('\x00'))
+            for checksum, text in s.iter_unpack(data[offset:end])
+        ]
+        return value, end
+
+
+ChecksumStrStruct_Unpack = ChecksumStrStructUnpacker()
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Type, Union, Tuple, List
+from typing import Type, Union, Tuple, List, Dict, Any, ClassVar
+
+import numpy as np
 
 from yk_gmd_blender.structurelib.base import StructureUnpacker, BaseUnpacker, PackingValidationError
 from yk_gmd_blender.gmdlib.structure.common.array_pointer import ArrayPointerStruct
@@ -23,6 +25,15 @@ class FileUnpackError(Exception):
 
 @dataclass(repr=False)
 class FileData_Common:
+    # Slotted so instances don't carry a __dict__. Subclasses must list their own fields in __slots__ as well.
+    __slots__ = (
+        "magic",
+        "file_endian_check",
+        "vertex_endian_check",
+        "version_combined",
+        "name",
+    )
+
     magic: str
     file_endian_check: int
     vertex_endian_check: int
@@ -39,43 +50,72 @@ class FileData_Common:
     def parse_version(self) -> VersionProperties:
         return get_combined_version_properties(self.version_combined)
 
+    # These lists don't change, so they're built once when the class is defined instead of on every call.
+    # Subclasses extend them rather than overriding header_pointer_fields() and header_fields_to_copy().
+    _header_pointer_fields: ClassVar[List[Tuple[str, Union[BaseUnpacker, Type[bytes]]]]] = []
+    _header_fields_to_copy: ClassVar[List[str]] = [
+        "magic",
+        "file_endian_check",
+        "vertex_endian_check",
+        "version_combined",
+
+        "name"
+    ]
+
     @classmethod
     def header_pointer_fields(cls) -> List[Tuple[str, Union[BaseUnpacker, Type[bytes]]]]:
         """
         Returns a List of (header field name, packing type).
 
         Each element of the list is added to the file in the following way:
-        If the packing type is bytes, the byte contents are added to the file data and the header field is set to a SizedPointer
+        If the packing type is bytes, the byte contents are added to the file data and the header field is set to a SizedPointer.
+        When unpacking, byte contents are returned as memoryviews into the file data rather than copies.
         If the packing type is a BaseUnpacker, the packer is used to pack the data and the header field is set to an ArrayPointer
+
+        The list is shared between calls, so it must not be modified.
         """
-        return []
+        return cls._header_pointer_fields
 
     @classmethod
     def header_fields_to_copy(cls) -> List[str]:
         """
         Returns a list of fields to copy from the header into the FileData
+        The list is shared between calls, so it must not be modified.
         :return: a list of fields to copy from the header into the FileData
         """
-        return [
-            "magic",
-            "file_endian_check",
-            "vertex_endian_check",
-            "version_combined",
-
-            "name"
-        ]
+        return cls._header_fields_to_copy
 
 
 # TODO: Generics?
 # TODO: Refactor to do typechecking for header_pointer_fields, header_fields_to_copy, including missing fields
 class FilePacker(BaseUnpacker[FileData_Common]):
     header_packer: StructureUnpacker[GMDHeaderStruct]
+    # The field lists for python_type are fixed, so they're resolved once here instead of on every (un)pack.
+    # _bytes_fields and _array_fields split _pointer_fields by packing type, so unpack() doesn't dispatch per-field.
+    _fields_to_copy: Tuple[str, ...]
+    _pointer_fields: Tuple[Tuple[str, Union[BaseUnpacker, Type[bytes]]], ...]
+    _bytes_fields: Tuple[str, ...]
+    _array_fields: Tuple[Tuple[str, BaseUnpacker], ...]
 
     def __init__(self, filedata_type: Type[FileData_Common], header_packer: StructureUnpacker[GMDHeaderStruct]):
         super().__init__(filedata_type)
         self.header_packer = header_packer
         # TODO: Check python_type.packing_type() fields to ensure correctness
 
+        self._fields_to_copy = tuple(filedata_type.header_fields_to_copy())
+        self._pointer_fields = tuple(filedata_type.header_pointer_fields())
+        bytes_fields = []
+        array_fields = []
+        for name, packer in self._pointer_fields:
+            if packer is bytes:
+                bytes_fields.append(name)
+            elif isinstance(packer, BaseUnpacker):
+                array_fields.append((name, packer))
+            else:
+                raise TypeError(f"Unexpected packer type {packer} for field {filedata_type.__name__}.{name}")
+        self._bytes_fields = tuple(bytes_fields)
+        self._array_fields = tuple(array_fields)
+
     def pack(self, big_endian: bool, value: FileData_Common, append_to: bytearray):
         # Packing phases
         # 1. Pack contents (NOT HEADER) into bytes to get addresses and sizes
@@ -96,33 +136,29 @@ class FilePacker(BaseUnpacker[FileData_Common]):
             SizedPointerStruct, ArrayPointerStruct]:
             ptr = header_size + len(collective_data)
 
-            attr: Union[bytes, list] = getattr(value, name)
+            attr: Union[bytes, memoryview, list, np.ndarray] = getattr(value, name)
             sized_pointer = SizedPointerStruct(ptr=ptr, size=len(attr))
             if packer is bytes:
-                if not isinstance(attr, bytes):
+                if not isinstance(attr, (bytes, memoryview)):
                     raise TypeError(
                         f"Value field {name} was expected to be bytes, because {self.python_type.__name__} specified it to be byte-packed")
                 collective_data += attr
                 return sized_pointer
             elif isinstance(packer, BaseUnpacker):
-                if not isinstance(attr, list):
+                if not isinstance(attr, (list, np.ndarray)):
                     raise TypeError(
-                        f"Header field {name} was expected as list, because {self.python_type.__name__} specified it to be packed by {packer}")
-                for i, item in enumerate(attr):
-                    try:
-                        packer.pack(big_endian, item, collective_data)
-                    except PackingValidationError as e:
-                        raise PackingValidationError(f"Element {i}: {e}")
+                        f"Header field {name} was expected as list or array, because {self.python_type.__name__} specified it to be packed by {packer}")
+                packer.pack_array(big_endian, attr, collective_data)
                 return ArrayPointerStruct(sized_ptr=sized_pointer)
             else:
                 raise TypeError(f"Unexpected packer type {packer}")
 
         header_copies = {}
-        for name in self.python_type.header_fields_to_copy():
+        for name in self._fields_to_copy:
             header_copies[name] = getattr(value, name)
 
         element_pointers = {}
-        for name, packer in self.python_type.header_pointer_fields():
+        for name, packer in self._pointer_fields:
             try:
                 element_pointers[name] = pack_data(name, packer, collective_data)
             except PackingValidationError as e:
@@ -139,7 +175,16 @@ class FilePacker(BaseUnpacker[FileData_Common]):
         self.header_packer.pack(big_endian, header, append_to)
         append_to += collective_data
 
-    def unpack(self, big_endian: bool, data: Union[bytes, bytearray], offset: int) -> Tuple[FileData_Common, int]:
+    def unpack(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int) -> Tuple[FileData_Common, int]:
+        _, file_data = self.unpack_with_header(big_endian, data, offset)
+        return file_data, -1
+
+    def unpack_with_header(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int) \
+            -> Tuple[GMDHeaderStruct, FileData_Common]:
+        """
+        Unpacks the file, and also returns the header it was unpacked from,
+        so callers that need both don't have to unpack the header twice.
+        """
         # Unpacking phases
         # 1. Unpack the header
         # No subclass intervention required as long as header_packer is set
@@ -148,42 +193,36 @@ class FilePacker(BaseUnpacker[FileData_Common]):
 
         header, offset = self.header_packer.unpack(big_endian, data, offset)
 
-        def unpack_data(name: str, unpacker: Union[Type[bytes], BaseUnpacker]):
-            attr = getattr(header, name)
-            if unpacker is bytes:
-                if not isinstance(attr, SizedPointerStruct):
-                    raise TypeError(
-                        f"Header field {name} was expected as SizedPointer but was {attr}. "
-                        f"Reason: {self.python_type.__name__} specified it to be byte-packed")
-                return attr.extract_bytes(data)
-            elif isinstance(unpacker, BaseUnpacker):
-                if not isinstance(attr, ArrayPointerStruct):
-                    raise TypeError(
-                        f"Header field {name} was expected as ArrayPointer but was {attr}. "
-                        f"Reason: {self.python_type.__name__} specified it to be packed by {unpacker}")
-                try:
-                    return attr.extract(unpacker, big_endian, data)
-                except Exception as e:
-                    raise FileUnpackError(
-                        f"Exception while unpacking field {name} from 0x{attr.ptr:x}[{attr.count}]: {e}")
-            else:
-                raise TypeError(f"Unexpected unpacker type {unpacker}")
-
         header_copies = {}
-        for name in self.python_type.header_fields_to_copy():
+        for name in self._fields_to_copy:
             header_copies[name] = getattr(header, name)
 
-        data_dict = {
-            k: unpack_data(k, v)
-            for k, v in self.python_type.header_pointer_fields()
-        }
+        data_dict: Dict[str, Any] = {}
+        for name in self._bytes_fields:
+            attr = getattr(header, name)
+            if not isinstance(attr, SizedPointerStruct):
+                raise TypeError(
+                    f"Header field {name} was expected as SizedPointer but was {attr}. "
+                    f"Reason: {self.python_type.__name__} specified it to be byte-packed")
+            data_dict[name] = attr.extract_bytes(data)
+        for name, unpacker in self._array_fields:
+            attr = getattr(header, name)
+            if not isinstance(attr, ArrayPointerStruct):
+                raise TypeError(
+                    f"Header field {name} was expected as ArrayPointer but was {attr}. "
+                    f"Reason: {self.python_type.__name__} specified it to be packed by {unpacker}")
+            try:
+                data_dict[name] = attr.extract(unpacker, big_endian, data)
+            except Exception as e:
+                raise FileUnpackError(
+                    f"Exception while unpacking field {name} from 0x{attr.ptr:x}[{attr.count}]: {e}")
 
         file_data = self.python_type(
             **header_copies,
             **data_dict
         )
 
-        return file_data, -1
+        return header, file_data
 
     def validate_value(self, value: FileData_Common):
         raise NotImplementedError()
@@ -1,14 +1,47 @@
+from typing import List, Tuple, Union, Sequence
+
 import mathutils
+import numpy as np
 
-from yk_gmd_blender.structurelib.base import ValueAdaptor, FixedSizeArrayUnpacker
+from yk_gmd_blender.structurelib.base import ValueAdaptor, FixedSizeArrayUnpacker, PackingValidationError
 from yk_gmd_blender.structurelib.primitives import c_float32
 
-MatrixUnpacker = ValueAdaptor(mathutils.Matrix,
-                              FixedSizeArrayUnpacker(c_float32, 16),
-                              # The array is column-major, but the matrix constructor takes rows
-                              # Solution - pass the columns in as rows, and then transpose
-                              lambda arr: mathutils.Matrix((arr[0:4], arr[4:8], arr[8:12], arr[12:16])).transposed(),
-                              # Column-major = each column concatenated
-                              lambda matrix: list(matrix.col[0]) + list(matrix.col[1]) + list(matrix.col[2]) + list(
-                                  matrix.col[3])
-                              )
+
+class MatrixArrayUnpacker(ValueAdaptor[List[float], mathutils.Matrix]):
+    """
+    Unpacks single matrices as mathutils.Matrix, but unpacks arrays of matrices in one go
+    into a contiguous (N, 4, 4) float32 array, indexed the same way as a Matrix i.e. arr[i][row][col].
+    """
+
+    def __init__(self):
+        super().__init__(mathutils.Matrix,
+                         FixedSizeArrayUnpacker(c_float32, 16),
+                         # The array is column-major, but the matrix constructor takes rows
+                         # Solution - pass the columns in as rows, and then transpose
+                         lambda arr: mathutils.Matrix((arr[0:4], arr[4:8], arr[8:12], arr[12:16])).transposed(),
+                         # Column-major = each column concatenated
+                         lambda matrix: list(matrix.col[0]) + list(matrix.col[1]) + list(matrix.col[2]) + list(
+                             matrix.col[3])
+                         )
+
+    def unpack_array(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int, count: int) \
+            -> Tuple[np.ndarray, int]:
+        file_dtype = np.dtype(np.float32).newbyteorder(">" if big_endian else "<")
+        columns = np.frombuffer(data, dtype=file_dtype, count=count * 16, offset=offset).reshape(count, 4, 4)
+        # Transpose each column-major matrix into rows
+        return np.ascontiguousarray(columns.transpose(0, 2, 1), dtype=np.float32), offset + count * self.sizeof()
+
+    def pack_array(self, big_endian: bool, value: Union[Sequence[mathutils.Matrix], np.ndarray],
+                   append_to: bytearray):
+        # Accepts either an (N, 4, 4) array or a list of mathutils.Matrix
+        if len(value) == 0:
+            return
+        arr = np.asarray(value, dtype=np.float32)
+        if arr.shape != (len(value), 4, 4):
+            raise PackingValidationError(f"Expected {len(value)} 4x4 matrices, got array of shape {arr.shape}")
+        # Column-major = each column concatenated
+        file_dtype = np.dtype(np.float32).newbyteorder(">" if big_endian else "<")
+        append_to += arr.transpose(0, 2, 1).astype(file_dtype).tobytes()
+
+
+MatrixUnpacker = MatrixArrayUnpacker()
@@ -1,12 +1,17 @@
 from dataclasses import dataclass
 from typing import List
 
-from yk_gmd_blender.structurelib.base import StructureUnpacker
+from yk_gmd_blender.structurelib.base import StructureUnpacker, FrozenSlotsMixin
 from yk_gmd_blender.structurelib.primitives import c_uint32
 
 
 @dataclass(frozen=True)
-class IndicesStruct:
+class IndicesStruct(FrozenSlotsMixin):
+    __slots__ = (
+        "index_offset",
+        "index_count",
+    )
+
     index_offset: int
     index_count: int
 
@@ -24,7 +29,23 @@ IndicesStruct_Unpack = StructureUnpacker(
 
 
 @dataclass(frozen=True)
-class MeshStruct:
+class MeshStruct(FrozenSlotsMixin):
+    __slots__ = (
+        "index",
+        "attribute_index",
+        "vertex_buffer_index",
+        "object_index",
+        "node_index",
+        "min_index",
+        "vertex_count",
+        "vertex_offset_from_index",
+        "matrixlist_offset",
+        "matrixlist_length",
+        "triangle_list_indices",
+        "noreset_strip_indices",
+        "reset_strip_indices",
+    )
+
     # Index of the Mesh structure in the array
     index: int
     # Mapped attribute set index
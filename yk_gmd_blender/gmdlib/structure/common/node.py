@@ -3,7 +3,7 @@ from enum import IntEnum
 from typing import List
 
 from mathutils import Vector, Quaternion
-from yk_gmd_blender.structurelib.base import StructureUnpacker, ValueAdaptor, FixedSizeArrayUnpacker
+from yk_gmd_blender.structurelib.base import StructureUnpacker, ValueAdaptor, FixedSizeArrayUnpacker, FrozenSlotsMixin
 from yk_gmd_blender.structurelib.primitives import c_int32, c_uint32
 from yk_gmd_blender.gmdlib.structure.common.vector import Vec4Unpacker, QuatUnpacker
 
@@ -22,7 +22,24 @@ class NodeType(IntEnum):
 
 
 @dataclass(frozen=True)
-class NodeStruct:
+class NodeStruct(FrozenSlotsMixin):
+    __slots__ = (
+        "index",
+        "parent_of",
+        "sibling_of",
+        "object_index",
+        "matrix_index",
+        "stack_op",
+        "name_index",
+        "node_type",
+        "pos",
+        "rot",
+        "scale",
+        "world_pos",
+        "anim_axis",
+        "flags",
+    )
+
     index: int
     parent_of: int
     sibling_of: int
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Union
 
 from yk_gmd_blender.structurelib.base import StructureUnpacker
 from yk_gmd_blender.structurelib.primitives import c_uint32
@@ -9,8 +10,9 @@ class SizedPointerStruct:
     ptr: int
     size: int
 
-    def extract_bytes(self, data: bytes):
-        return data[self.ptr:self.ptr + self.size]
+    def extract_bytes(self, data: Union[bytes, bytearray, memoryview]) -> memoryview:
+        # Return a view instead of slicing the bytes, so large sections like vertex data aren't copied
+        return memoryview(data)[self.ptr:self.ptr + self.size]
 
     def __repr__(self):
         return f"{self.__class__.__name__}(ptr=0x{self.ptr:x}, size={self.size})"
@@ -1,9 +1,9 @@
 from dataclasses import dataclass
-from typing import List, Tuple, Union, Type
+from typing import List, Union
 
-import mathutils
+import numpy as np
 
-from yk_gmd_blender.structurelib.base import BaseUnpacker
+from yk_gmd_blender.structurelib.primitives import c_uint16_bulk
 from yk_gmd_blender.gmdlib.structure.common.checksum_str import ChecksumStrStruct, ChecksumStrStruct_Unpack
 from yk_gmd_blender.gmdlib.structure.common.file import FileData_Common, FilePacker
 from yk_gmd_blender.gmdlib.structure.common.matrix import MatrixUnpacker
@@ -22,6 +22,28 @@ from yk_gmd_blender.gmdlib.structure.yk1.vertex_buffer_layout import VertexBuffe
 
 @dataclass(repr=False)
 class FileData_Dragon(FileData_Common):
+    __slots__ = (
+        "overall_bounds",
+        "node_arr",
+        "obj_arr",
+        "mesh_arr",
+        "attribute_arr",
+        "material_arr",
+        "matrix_arr",
+        "vertex_buffer_arr",
+        "vertex_data",
+        "texture_arr",
+        "shader_arr",
+        "node_name_arr",
+        "index_data",
+        "object_drawlist_bytes",
+        "mesh_matrixlist_bytes",
+        "unk12",
+        "unk13",
+        "unk14",
+        "flags",
+    )
+
     overall_bounds: BoundsDataStruct_YK1
 
     node_arr: List[NodeStruct]
@@ -29,15 +51,15 @@ class FileData_Dragon(FileData_Common):
     mesh_arr: List[MeshStruct_YK1]
     attribute_arr: List[AttributeStruct_Dragon]
     material_arr: List[MaterialStruct_YK1]
-    matrix_arr: List[mathutils.Matrix]
+    matrix_arr: np.ndarray  # (N, 4, 4) float32
     vertex_buffer_arr: List[VertexBufferLayoutStruct_YK1]
-    vertex_data: bytes  # byte data
+    vertex_data: Union[bytes, memoryview]  # byte data
     texture_arr: List[ChecksumStrStruct]
     shader_arr: List[ChecksumStrStruct]
     node_name_arr: List[ChecksumStrStruct]
-    index_data: List[int]
-    object_drawlist_bytes: bytes
-    mesh_matrixlist_bytes: bytes
+    index_data: np.ndarray  # uint16 when unpacked. Any int dtype when packing, range-checked to uint16
+    object_drawlist_bytes: Union[bytes, memoryview]
+    mesh_matrixlist_bytes: Union[bytes, memoryview]
 
     unk12: List[Unk12Struct]
     unk13: List[int]
@@ -53,34 +75,29 @@ class FileData_Dragon(FileData_Common):
         s += "}"
         return s
 
-    @classmethod
-    def header_pointer_fields(cls) -> List[Tuple[str, Union[BaseUnpacker, Type[bytes]]]]:
-        return FileData_Common.header_pointer_fields() + [
-            ("node_arr", NodeStruct_Unpack),
-            ("obj_arr", ObjectStruct_YK1_Unpack),
-            ("mesh_arr", MeshStruct_YK1_Unpack),
-            ("attribute_arr", AttributeStruct_Dragon_Unpack),
-            ("material_arr", MaterialStruct_YK1_Unpack),
-            ("matrix_arr", MatrixUnpacker),
-            ("vertex_buffer_arr", VertexBufferLayoutStruct_YK1_Unpack),
-            ("vertex_data", bytes),
-            ("texture_arr", ChecksumStrStruct_Unpack),
-            ("shader_arr", ChecksumStrStruct_Unpack),
-            ("node_name_arr", ChecksumStrStruct_Unpack),
-            ("index_data", c_uint16),
-            ("object_drawlist_bytes", bytes),
-            ("mesh_matrixlist_bytes", bytes),
-            ("unk12", Unk12Struct_Unpack),
-            ("unk13", c_uint16),
-            ("unk14", Unk14Struct_Unpack),
-        ]
-
-    @classmethod
-    def header_fields_to_copy(cls) -> List[str]:
-        return FileData_Common.header_fields_to_copy() + [
-            "overall_bounds",
-            "flags"
-        ]
+    _header_pointer_fields = FileData_Common._header_pointer_fields + [
+        ("node_arr", NodeStruct_Unpack),
+        ("obj_arr", ObjectStruct_YK1_Unpack),
+        ("mesh_arr", MeshStruct_YK1_Unpack),
+        ("attribute_arr", AttributeStruct_Dragon_Unpack),
+        ("material_arr", MaterialStruct_YK1_Unpack),
+        ("matrix_arr", MatrixUnpacker),
+        ("vertex_buffer_arr", VertexBufferLayoutStruct_YK1_Unpack),
+        ("vertex_data", bytes),
+        ("texture_arr", ChecksumStrStruct_Unpack),
+        ("shader_arr", ChecksumStrStruct_Unpack),
+        ("node_name_arr", ChecksumStrStruct_Unpack),
+        ("index_data", c_uint16_bulk),
+        ("object_drawlist_bytes", bytes),
+        ("mesh_matrixlist_bytes", bytes),
+        ("unk12", Unk12Struct_Unpack),
+        ("unk13", c_uint16),
+        ("unk14", Unk14Struct_Unpack),
+    ]
+    _header_fields_to_copy = FileData_Common._header_fields_to_copy + [
+        "overall_bounds",
+        "flags"
+    ]
 
 
 FilePacker_Dragon = FilePacker(
@@ -7,7 +7,7 @@ from yk_gmd_blender.gmdlib.structure.common.mesh import MeshStruct, IndicesStruc
 
 @dataclass(frozen=True)
 class MeshStruct_YK1(MeshStruct):
-    pass
+    __slots__ = ()
 
 
 MeshStruct_YK1_Unpack = StructureUnpacker(
@@ -85,7 +85,8 @@ class VecStorage:
             # it's always safe to cast uint8 -> float16 and float32, they can represent all values
             data = src.astype(expected_dtype, casting='safe')
             # (0, 255) -> (0, 1) by dividing by 255
-            data = data / 255.0
+            # data is a fresh copy, so transform it in-place instead of allocating temporaries
+            data /= 255.0
             return data
         elif self.comp_fmt == VecCompFmt.Byte_Minus1_1:
             # src must have dtype == vector of uint8
@@ -93,7 +94,9 @@ class VecStorage:
             data = src.astype(expected_dtype, casting='safe')
             # (0, 255) -> (0, 1) by dividing by 255
             # (0, 1) -> (-1, 1) by multiplying by 2, subtracting 1
-            data = ((data / 255.0) * 2.0) - 1.0
+            data /= 255.0
+            data *= 2.0
+            data -= 1.0
             return data
         raise RuntimeError(f"Invalid VecStorage called transform_native_fmt_array: {self}")
 
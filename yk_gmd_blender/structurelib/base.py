@@ -1,12 +1,18 @@
 import struct
-from dataclasses import dataclass
-from typing import Union, Tuple, Type, Optional, TypeVar, Generic, List, get_type_hints, Dict, Callable
+from dataclasses import dataclass, fields
+from types import MemberDescriptorType
+from typing import Union, Tuple, Type, Optional, TypeVar, Generic, List, get_type_hints, Dict, Callable, Sequence, \
+    cast, Any
+
+import numpy as np
 
 __all__ = [
     "BaseUnpacker",
+    "BulkIntUnpacker",
     "StructureUnpacker",
     "FixedSizeArrayUnpacker",
     "FixedSizeASCIIUnpacker",
+    "FrozenSlotsMixin",
     "ValueAdaptor",
     "structure_data",
 ]
@@ -28,12 +34,29 @@ class BaseUnpacker(Generic[T]):
             raise TypeError(f"python_type of Unpacker must be a type object, got {python_type}")
         self.python_type = python_type
 
-    def unpack(self, big_endian: bool, data: Union[bytes, bytearray], offset: int) -> Tuple[T, int]:
+    def unpack(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int) -> Tuple[T, int]:
         raise NotImplementedError()
 
     def pack(self, big_endian: bool, value: T, append_to: bytearray):
         raise NotImplementedError()
 
+    def unpack_array(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int, count: int) \
+            -> Tuple[Union[List[T], np.ndarray], int]:
+        # Subclasses can override this to unpack the whole array at once
+        value: List[T] = []
+        while len(value) < count:
+            next_val, offset = self.unpack(big_endian, data, offset)
+            value.append(next_val)
+        return value, offset
+
+    def pack_array(self, big_endian: bool, value: Union[Sequence[T], np.ndarray], append_to: bytearray):
+        # Subclasses can override this to pack the whole array at once
+        for i, item in enumerate(value):
+            try:
+                self.pack(big_endian, item, append_to)
+            except PackingValidationError as e:
+                raise PackingValidationError(f"Element {i}: {e}")
+
     def validate_value(self, value: T):
         raise NotImplementedError()
 
@@ -60,7 +83,7 @@ class ValueAdaptor(Generic[TFrom, TTo], BaseUnpacker[TTo]):
         self.forwards = forwards
         self.backwards = backwards
 
-    def unpack(self, big_endian: bool, data: Union[bytes, bytearray], offset: int) -> Tuple[TTo, int]:
+    def unpack(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int) -> Tuple[TTo, int]:
         from_val, offset = self.base_unpacker.unpack(big_endian, data, offset)
         return self.forwards(from_val), offset
 
@@ -85,25 +108,30 @@ class BasePrimitive(BaseUnpacker[T]):
     struct_fmt: str
     be_struct_fmt: str
     le_struct_fmt: str
+    # Precompiled versions of the formats, so the format string isn't looked up on every call
+    be_struct: struct.Struct
+    le_struct: struct.Struct
 
     def __init__(self, python_type: Type[T], struct_fmt: str):
         super().__init__(python_type)
         self.struct_fmt = struct_fmt
         self.be_struct_fmt = f">{struct_fmt}"
         self.le_struct_fmt = f"<{struct_fmt}"
+        self.be_struct = struct.Struct(self.be_struct_fmt)
+        self.le_struct = struct.Struct(self.le_struct_fmt)
 
     # unpack() -> get the value out of the data.
     #    a freshly unpacked value should always be valid => don't validate
     # pack() -> take a value, pack into bytes
     #    a value may not always be packable (e.g. a string that's too long) so always validate_value() before packing.
 
-    def unpack(self, big_endian: bool, data: Union[bytes, bytearray], offset: int) -> Tuple[T, int]:
-        return struct.unpack_from(self.be_struct_fmt if big_endian else self.le_struct_fmt, data, offset)[
-                   0], offset + self.sizeof()
+    def unpack(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int) -> Tuple[T, int]:
+        s = self.be_struct if big_endian else self.le_struct
+        return s.unpack_from(data, offset)[0], offset + s.size
 
     def pack(self, big_endian: bool, value: T, append_to: bytearray):
         self.validate_value(value)
-        append_to += struct.pack(self.be_struct_fmt if big_endian else self.le_struct_fmt, value)
+        append_to += (self.be_struct if big_endian else self.le_struct).pack(value)
 
     def validate_value(self, value: T):
         if not isinstance(value, self.python_type):
@@ -111,7 +139,7 @@ class BasePrimitive(BaseUnpacker[T]):
 
     def sizeof(self):
         # Assumed that be_struct_format is hte same size as le_struct_fmt
-        return struct.calcsize(self.be_struct_fmt)
+        return self.be_struct.size
 
 
 class BoundedPrimitiveUnpacker(BasePrimitive[T]):
@@ -127,6 +155,39 @@ class BoundedPrimitiveUnpacker(BasePrimitive[T]):
             raise PackingValidationError(f"Value {value} not in range {self.range}")
 
 
+class BulkIntUnpacker(BoundedPrimitiveUnpacker[int]):
+    """
+    Integer primitive which unpacks and packs arrays in a single NumPy call, instead of one element at a time.
+    Arrays are unpacked as NumPy arrays with a native-endian dtype, instead of lists.
+    """
+    dtype: np.dtype
+
+    def __init__(self, struct_fmt: str, range: Tuple[int, int], dtype: Type[np.integer]):
+        super().__init__(int, struct_fmt, range)
+        self.dtype = np.dtype(dtype)
+        if self.dtype.itemsize != self.sizeof():
+            raise TypeError(f"dtype {self.dtype} doesn't match struct format {struct_fmt}")
+
+    def unpack_array(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int, count: int) \
+            -> Tuple[np.ndarray, int]:
+        file_dtype = self.dtype.newbyteorder(">" if big_endian else "<")
+        # astype() copies the values out of data, so the array doesn't keep the whole file alive
+        value = np.frombuffer(data, dtype=file_dtype, count=count, offset=offset).astype(self.dtype)
+        return value, offset + count * self.sizeof()
+
+    def pack_array(self, big_endian: bool, value: Union[Sequence[int], np.ndarray], append_to: bytearray):
+        arr = np.asarray(value)
+        if arr.size == 0:
+            return
+        if arr.dtype.kind not in "iu":
+            raise PackingValidationError(f"Expected an array of int, got {arr.dtype}")
+        out_of_range = np.flatnonzero((arr < self.range[0]) | (arr > self.range[1]))
+        if out_of_range.size:
+            i = int(out_of_range[0])
+            raise PackingValidationError(f"Element {i}: Value {arr[i]} not in range {self.range}")
+        append_to += arr.astype(self.dtype.newbyteorder(">" if big_endian else "<")).tobytes()
+
+
 class FixedSizeASCIIUnpacker(BaseUnpacker[str]):
     length: int
     encoding: str
@@ -136,8 +197,8 @@ class FixedSizeASCIIUnpacker(BaseUnpacker[str]):
         self.length = length
         self.encoding = encoding
 
-    def unpack(self, big_endian: bool, data: Union[bytes, bytearray], offset: int) -> Tuple[T, int]:
-        str_data: bytes = data[offset:offset + self.length]
+    def unpack(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int) -> Tuple[T, int]:
+        str_data: bytes = bytes(data[offset:offset + self.length])
         return str_data.decode(self.encoding).rstrip('\x00'), offset + self.length
 
     def pack(self, big_endian: bool, value: T, append_to: bytearray):
@@ -159,13 +220,26 @@ class FixedSizeASCIIUnpacker(BaseUnpacker[str]):
 class FixedSizeArrayUnpacker(Generic[T], BaseUnpacker[List[T]]):
     elem_type: BaseUnpacker[T]
     count: int
+    # If elem_type is a plain struct primitive, the whole array is unpacked with one struct call
+    _be_struct: Optional[struct.Struct]
+    _le_struct: Optional[struct.Struct]
 
     def __init__(self, elem_type: BaseUnpacker[T], count: int):
         super().__init__(list)
         self.elem_type = elem_type
         self.count = count
+        if isinstance(elem_type, BasePrimitive) and type(elem_type).unpack is BasePrimitive.unpack:
+            self._be_struct = struct.Struct(f">{count}{elem_type.struct_fmt}")
+            self._le_struct = struct.Struct(f"<{count}{elem_type.struct_fmt}")
+        else:
+            self._be_struct = None
+            self._le_struct = None
+
+    def unpack(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int) -> Tuple[List[T], int]:
+        s = self._be_struct if big_endian else self._le_struct
+        if s is not None:
+            return list(s.unpack_from(data, offset)), offset + s.size
 
-    def unpack(self, big_endian: bool, data: Union[bytes, bytearray], offset: int) -> Tuple[List[T], int]:
         value = []
         while len(value) < self.count:
             next_val, offset = self.elem_type.unpack(big_endian, data, offset)
@@ -200,6 +274,22 @@ def structure_data(**kwargs):
     return dataclass(**kwargs, frozen=True, init=True)
 
 
+class FrozenSlotsMixin:
+    """
+    Base for frozen dataclasses which declare their own __slots__.
+    copy and pickle restore slot state with setattr(), which a frozen dataclass rejects,
+    so the fields are saved as a tuple and restored with object.__setattr__ instead.
+    """
+    __slots__ = ()
+
+    def __getstate__(self):
+        return tuple(getattr(self, f.name) for f in fields(cast(Any, self)))
+
+    def __setstate__(self, state):
+        for f, value in zip(fields(cast(Any, self)), state):
+            object.__setattr__(self, f.name, value)
+
+
 MaybeOptionalBaseUnpacker = Union[Type[T], Type[Optional[T]]]
 
 
@@ -207,6 +297,9 @@ class StructureUnpacker(BaseUnpacker[TDataclass]):
     _fields: List[Tuple[str, BaseUnpacker]]
     _exported_fields: Dict[str, BaseUnpacker]
     _load_validate: Optional[Callable[[TDataclass], None]]
+    # If every field is a plain struct primitive, the whole structure is unpacked with one struct call
+    _be_struct: Optional[struct.Struct]
+    _le_struct: Optional[struct.Struct]
 
     def __init__(self, python_type: Type[TDataclass], fields: List[Tuple[str, BaseUnpacker]],
                  base_class_unpackers: Dict[Type, 'StructureUnpacker'] = None,
@@ -249,7 +342,9 @@ class StructureUnpacker(BaseUnpacker[TDataclass]):
         for field_name, field_type in dataclass_field_hints.items():
             # If the name isn't unpacked, and the field isn't optional, error
             if field_name not in named_field_unpackers:
-                if hasattr(python_type, field_name):
+                # Slot descriptors are class attributes too, but don't mean the field has a default value
+                if hasattr(python_type, field_name) and \
+                        not isinstance(getattr(python_type, field_name), MemberDescriptorType):
                     # Name has a default value (assumes dataclass.field() always allows the field to be optional)
                     continue
                 else:
@@ -270,12 +365,28 @@ class StructureUnpacker(BaseUnpacker[TDataclass]):
         self._exported_fields = _exported_fields
         self._load_validate = load_validate
 
-    def unpack(self, big_endian: bool, data: Union[bytes, bytearray], offset: int) -> Tuple[TDataclass, int]:
+        if fields and all(isinstance(u, BasePrimitive) and type(u).unpack is BasePrimitive.unpack for _, u in fields):
+            fmt = "".join(cast(BasePrimitive, u).struct_fmt for _, u in fields)
+            self._be_struct = struct.Struct(f">{fmt}")
+            self._le_struct = struct.Struct(f"<{fmt}")
+        else:
+            self._be_struct = None
+            self._le_struct = None
+
+    def unpack(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int) \
+            -> Tuple[TDataclass, int]:
         items_dict = {}
-        for field_name, field_unpacker in self._fields:
-            value, offset = field_unpacker.unpack(big_endian, data, offset)
-            if field_name in self._exported_fields:
-                items_dict[field_name] = value
+        s = self._be_struct if big_endian else self._le_struct
+        if s is not None:
+            for (field_name, _), value in zip(self._fields, s.unpack_from(data, offset)):
+                if field_name in self._exported_fields:
+                    items_dict[field_name] = value
+            offset += s.size
+        else:
+            for field_name, field_unpacker in self._fields:
+                value, offset = field_unpacker.unpack(big_endian, data, offset)
+                if field_name in self._exported_fields:
+                    items_dict[field_name] = value
 
         value = self.python_type(**items_dict)
         if self._load_validate:
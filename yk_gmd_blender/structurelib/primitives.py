@@ -3,6 +3,8 @@ __all__ = [
     "c_uint16",
     "c_uint32",
 
+    "c_uint16_bulk",
+
     "c_int8",
     "c_int16",
     "c_int32",
@@ -15,13 +17,19 @@ __all__ = [
 
 from typing import *
 
-from yk_gmd_blender.structurelib.base import BoundedPrimitiveUnpacker, BasePrimitive
+import numpy as np
+
+from yk_gmd_blender.structurelib.base import BoundedPrimitiveUnpacker, BasePrimitive, BulkIntUnpacker
 
 c_uint8 = BoundedPrimitiveUnpacker(struct_fmt="B", python_type=int, range=(0, 255))
 c_uint16 = BoundedPrimitiveUnpacker(struct_fmt="H", python_type=int, range=(0, 65_535))
 c_uint32 = BoundedPrimitiveUnpacker(struct_fmt="I", python_type=int, range=(0, 4_294_967_295))
 c_uint64 = BoundedPrimitiveUnpacker(struct_fmt="Q", python_type=int, range=(0, 18_446_744_073_709_551_615))
 
+# Same as c_uint16, but arrays are unpacked into NumPy uint16 arrays in one go.
+# Used for large arrays like index buffers.
+c_uint16_bulk = BulkIntUnpacker(struct_fmt="H", range=(0, 65_535), dtype=np.uint16)
+
 c_int8 = BoundedPrimitiveUnpacker(struct_fmt="b", python_type=int, range=(-128, 127))
 c_int16 = BoundedPrimitiveUnpacker(struct_fmt="h", python_type=int, range=(-32_768, 32_767))
 c_int32 = BoundedPrimitiveUnpacker(struct_fmt="i", python_type=int, range=(-2_147_483_648, 2_147_483_647))
@@ -40,7 +48,7 @@ class U8ConverterPrimitive(BoundedPrimitiveUnpacker[float]):
         self.start = to_range[0]
         self.width = to_range[1] - to_range[0]
 
-    def unpack(self, big_endian: bool, data: Union[bytes, bytearray], offset: int) -> Tuple[float, int]:
+    def unpack(self, big_endian: bool, data: Union[bytes, bytearray, memoryview], offset: int) -> Tuple[float, int]:
         value, offset = c_uint8.unpack(big_endian, data, offset)
 
         float_0_1 = value / 255.0